@@ -19,7 +19,7 @@ from core.whisper_manager import WhisperManager
 from core.services.notification_service import NotificationService
 from core.services.error_handling_service import ErrorHandlingService
 from core.models.config import cfg, APP_MODELS_DIR # Added APP_MODELS_DIR
-from core.events import event_bus
+from core.events import event_bus, UiEventRelay
 from core.services.environment_service import EnvironmentService
 from .i18n import initialize_translation
 
@@ -88,6 +88,12 @@ class AppContainer(containers.DeclarativeContainer):
     # 定义事件总线（单例）
     event_bus_instance = providers.Object(event_bus)
     
+    # 定义UI事件中继 - 将界面相关事件转换为Qt信号
+    ui_event_relay = providers.Singleton(
+        UiEventRelay,
+        event_bus=event_bus_instance
+    )
+    
     # 定义音频服务 - 依赖错误处理服务
     audio_service = providers.Singleton(
         AudioService,
@@ -11,6 +11,7 @@ from core.events.event_types import (
     TaskEvent,
     TaskStateChangedEvent,
     TaskAddedEvent,
+    TasksAddedEvent,
     TaskRemovedEvent,
     TaskTimerUpdatedEvent,
     TranscriptionProgressEvent,
@@ -44,16 +45,20 @@ from core.events.event_types import (
     AudioInfoFailedEvent, # 新增导出
 )
 
+from core.events.ui_event_relay import UiEventRelay
+
 # 创建全局事件总线实例
 event_bus = EventBus()
 
 __all__ = [
     'event_bus',
     'EventBus',
+    'UiEventRelay',
     'BaseEvent',
     'TaskEvent',
     'TaskStateChangedEvent',
     'TaskAddedEvent',
+    'TasksAddedEvent',
     'TaskRemovedEvent',
     'TaskTimerUpdatedEvent',
     'TranscriptionProgressEvent',
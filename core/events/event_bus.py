@@ -7,18 +7,40 @@
 """
 
 import time
-from typing import Dict, List, Callable, Any, Optional, Type, TypeVar
+import types
+import weakref
+from typing import Dict, List, Callable, Any, Optional, Type, TypeVar, Iterable, Tuple, Union
 from loguru import logger
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, Qt, Signal, Slot
 
 # 事件数据类型
 T = TypeVar('T')
 
+
+def _make_ref(handler: Callable):
+    """生成订阅表中保存的处理函数引用
+    
+    绑定方法以弱引用保存，对象被回收后自动退出分发；
+    普通函数、lambda 等没有其他持有者，仍以强引用保存
+    
+    Args:
+        handler: 事件处理函数
+        
+    Returns:
+        处理函数本身或其弱引用
+    """
+    if isinstance(handler, types.MethodType):
+        return weakref.WeakMethod(handler)
+    return handler
+
+
 class EventBus(QObject):
     """应用程序事件总线，实现单例模式"""
     
     # 定义信号，传递事件名称和事件数据对象
-    event_occurred = Signal(str, object)
+    # 事件名称按 object 传递，分发时拿到的是 EventTypes 中的同一个字符串对象，
+    # 避免每次转换为 QString 再生成新的 Python 字符串，字典查找可直接命中缓存的哈希
+    event_occurred = Signal(object, object)
     
     _instance = None
     
@@ -35,8 +57,10 @@ class EventBus(QObject):
             return
             
         super().__init__()
-        # 存储事件订阅者
-        self._subscribers: Dict[str, List[Callable]] = {}
+        # 存储事件订阅者（绑定方法以 WeakMethod 保存）
+        self._subscribers: Dict[str, List[Any]] = {}
+        # 按订阅者对象记录其订阅，便于一次性取消（键为 id(owner)，订阅者被回收时自动清理）
+        self._owners: Dict[int, List[Tuple[str, Any]]] = {}
         # 存储事件历史（调试用）
         self._event_history: List[Dict] = []
         # 历史记录大小限制
@@ -45,7 +69,9 @@ class EventBus(QObject):
         self._debug = False
         
         # 连接信号到分发方法
-        self.event_occurred.connect(self._dispatch_event)
+        # 自动连接：在界面线程发布时直接分发；在工作线程发布时按队列连接投递到界面线程，
+        # 发布方立即返回，不会被处理函数阻塞
+        self.event_occurred.connect(self._dispatch_event, Qt.AutoConnection)
         
         # 标记为已初始化
         self._initialized = True
@@ -75,33 +101,71 @@ class EventBus(QObject):
         if self._debug:
             self._record_event(event_name, event_data)
             
+        # 订阅表按事件名称分桶，没有订阅者的事件无需经过信号分发
+        if not self._subscribers.get(event_name):
+            if self._debug:
+                logger.debug(f"发布事件（无订阅者）: {event_name}")
+            return
+            
         # 发出事件信号
         self.event_occurred.emit(event_name, event_data)
         
         if self._debug:
             logger.debug(f"发布事件: {event_name}, 数据: {event_data}")
     
-    def subscribe(self, event_name: str, handler: Callable) -> Callable:
+    def subscribe(self, event_name: str, handler: Callable, owner: Any = None) -> Callable:
         """订阅事件
         
         Args:
             event_name: 要订阅的事件名称
             handler: 事件处理函数，接受事件数据作为参数
+            owner: 订阅者对象，可选；指定后可通过 unsubscribe_all 一次性取消
             
         Returns:
             handler: 返回处理函数，便于后续取消订阅
         """
-        if event_name not in self._subscribers:
-            self._subscribers[event_name] = []
-            
-        if handler not in self._subscribers[event_name]:
-            self._subscribers[event_name].append(handler)
+        self._add_subscription(event_name, handler, owner)
             
         if self._debug:
             logger.debug(f"订阅事件: {event_name}")
             
         return handler
     
+    def subscribe_many(self, subscriptions: Union[Dict[str, Callable], Iterable[Tuple[str, Callable]]], owner: Any = None):
+        """批量订阅事件
+        
+        Args:
+            subscriptions: 事件名称到处理函数的映射，或 (事件名称, 处理函数) 序列
+            owner: 订阅者对象，可选；指定后可通过 unsubscribe_all 一次性取消
+        """
+        if hasattr(subscriptions, 'items'):
+            subscriptions = subscriptions.items()
+            
+        for event_name, handler in subscriptions:
+            self._add_subscription(event_name, handler, owner)
+                
+        if self._debug:
+            logger.debug("批量订阅事件完成")
+    
+    def _add_subscription(self, event_name: str, handler: Callable, owner: Any):
+        """添加一条订阅，并在指定订阅者时记录归属
+        
+        Args:
+            event_name: 事件名称
+            handler: 事件处理函数
+            owner: 订阅者对象，可为 None
+        """
+        handlers = self._subscribers.setdefault(event_name, [])
+        ref = _make_ref(handler)
+        if ref not in handlers:
+            handlers.append(ref)
+            if owner is not None:
+                owner_key = id(owner)
+                if owner_key not in self._owners:
+                    # 订阅者被回收时自动取消其订阅，避免 id 被复用后误删其他对象的订阅
+                    weakref.finalize(owner, self._release_owner, owner_key)
+                self._owners.setdefault(owner_key, []).append((event_name, ref))
+    
     def unsubscribe(self, event_name: str, handler: Callable) -> bool:
         """取消事件订阅
         
@@ -112,8 +176,10 @@ class EventBus(QObject):
         Returns:
             bool: 是否成功取消订阅
         """
-        if event_name in self._subscribers and handler in self._subscribers[event_name]:
-            self._subscribers[event_name].remove(handler)
+        handlers = self._subscribers.get(event_name)
+        ref = _make_ref(handler)
+        if handlers and ref in handlers:
+            handlers.remove(ref)
             
             if self._debug:
                 logger.debug(f"取消订阅事件: {event_name}")
@@ -121,6 +187,58 @@ class EventBus(QObject):
             return True
         return False
     
+    def unsubscribe_many(self, subscriptions: Union[Dict[str, Callable], Iterable[Tuple[str, Callable]]]):
+        """批量取消事件订阅，与 subscribe_many 对应
+        
+        Args:
+            subscriptions: 事件名称到处理函数的映射，或 (事件名称, 处理函数) 序列
+        """
+        if hasattr(subscriptions, 'items'):
+            subscriptions = subscriptions.items()
+            
+        for event_name, handler in subscriptions:
+            handlers = self._subscribers.get(event_name)
+            ref = _make_ref(handler)
+            if handlers and ref in handlers:
+                handlers.remove(ref)
+                
+        if self._debug:
+            logger.debug("批量取消订阅事件完成")
+    
+    def unsubscribe_all(self, owner: Any) -> int:
+        """取消某个订阅者通过 owner 参数登记的全部订阅
+        
+        订阅者被回收时会自动取消，显式调用可以更早地停止接收事件
+        
+        Args:
+            owner: 订阅时传入的订阅者对象
+            
+        Returns:
+            int: 取消的订阅数量
+        """
+        return self._release_owner(id(owner))
+    
+    def _release_owner(self, owner_key: int) -> int:
+        """移除某个订阅者登记的全部订阅
+        
+        Args:
+            owner_key: 订阅者的 id
+            
+        Returns:
+            int: 取消的订阅数量
+        """
+        removed = 0
+        for event_name, ref in self._owners.pop(owner_key, ()):
+            handlers = self._subscribers.get(event_name)
+            if handlers and ref in handlers:
+                handlers.remove(ref)
+                removed += 1
+                
+        if self._debug:
+            logger.debug(f"取消订阅者的全部订阅: {removed} 个")
+            
+        return removed
+    
     def get_event_history(self) -> List[Dict]:
         """获取事件历史记录
         
@@ -133,24 +251,40 @@ class EventBus(QObject):
         """清除事件历史记录"""
         self._event_history.clear()
     
-    @Slot(str, object)
-    def _dispatch_event(self, event_name: str, event_data: Any):
+    @Slot(object, object)
+    def _dispatch_event(self, event_name: str, event_data: Any, _weak_method=weakref.WeakMethod):
         """分发事件到订阅者
         
+        订阅表按事件名称分桶，查找为一次字典访问；WeakMethod 类型在定义时绑定为默认参数，
+        循环内按局部变量访问。每个处理函数单独捕获异常，一个订阅者出错不影响其他订阅者
+        
         Args:
             event_name: 事件名称
             event_data: 事件数据
         """
-        if event_name in self._subscribers:
-            for handler in self._subscribers[event_name]:
-                try:
-                    handler(event_data)
-                except Exception as e:
-                    logger.error(f"事件处理错误: {event_name}, 错误: {str(e)}")
-                    if self._debug:
-                        # 在调试模式下打印更详细的错误信息
-                        import traceback
-                        logger.error(f"详细错误: {traceback.format_exc()}")
+        handlers = self._subscribers.get(event_name)
+        if not handlers:
+            return
+            
+        # 遍历快照，处理函数中取消订阅不会影响本次分发
+        for entry in tuple(handlers):
+            if type(entry) is _weak_method:
+                handler = entry()
+                if handler is None:
+                    # 订阅对象已被回收，移出订阅表
+                    if entry in handlers:
+                        handlers.remove(entry)
+                    continue
+            else:
+                handler = entry
+            try:
+                handler(event_data)
+            except Exception as e:
+                logger.error(f"事件处理错误: {event_name}, 错误: {str(e)}")
+                if self._debug:
+                    # 在调试模式下打印更详细的错误信息
+                    import traceback
+                    logger.error(f"详细错误: {traceback.format_exc()}")
     
     def _record_event(self, event_name: str, event_data: Any):
         """记录事件到历史记录
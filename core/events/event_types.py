@@ -16,19 +16,19 @@ from core.models.transcription_model import TranscriptionParameters
 from core.models.environment_model import EnvironmentInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseEvent:
     """所有事件的基类"""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskEvent(BaseEvent):
     """任务相关事件的基类"""
     task_id: str  # 任务ID
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskStateChangedEvent(TaskEvent):
     """任务状态变更事件"""
     status: ProcessStatus  # 任务状态
@@ -37,90 +37,96 @@ class TaskStateChangedEvent(TaskEvent):
     output_path: str = ""  # 输出文件路径
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskAddedEvent(TaskEvent):
     """任务添加事件"""
     file_path: str  # 文件路径
     file_name: str  # 文件名
 
 
-@dataclass
+@dataclass(slots=True)
+class TasksAddedEvent(BaseEvent):
+    """批量任务添加事件，一次添加多个文件时代替逐个发布的任务添加事件"""
+    tasks: List[TaskAddedEvent]  # 按添加顺序排列的任务添加事件
+
+
+@dataclass(slots=True)
 class TaskRemovedEvent(TaskEvent):
     """任务移除事件"""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionProgressEvent(TaskEvent):
     """转录进度事件"""
 
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionCompletedEvent(BaseEvent):
     """转录完成事件 - 表示所有任务已完成"""
     # Removed total_duration as it was unused and always 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionErrorEvent(TaskEvent):
     """转录错误事件"""
     error: str  # 错误信息
     details: Dict[str, Any] = field(default_factory=dict)  # 错误详情
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentEvent(BaseEvent):
     """环境相关事件"""
     status: str  # 环境状态
     message: str = ""  # 状态消息
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerEvent(TaskEvent):
     """工作线程相关事件基类"""
     worker_id: str  # 工作线程ID
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerRegisteredEvent(WorkerEvent):
     """工作线程注册事件"""
     source_file: str = ""  # 源文件路径
     worker_type: str = ""  # 工作线程类型
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerUnregisteredEvent(WorkerEvent):
     """工作线程注销事件"""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerProgressEvent(WorkerEvent):
     """工作线程进度事件"""
     message: str  # 进度消息
     progress: float = 0.0  # 进度值
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerCompletedEvent(WorkerEvent):
     """工作线程成功完成事件"""
     data: Dict[str, Any] = field(default_factory=dict)  # 结果数据
 
-@dataclass
+@dataclass(slots=True)
 class WorkerFailedEvent(WorkerEvent):
     """工作线程失败事件"""
     error: str  # 错误信息
     details: Dict[str, Any] = field(default_factory=dict)  # 错误详情
 
-@dataclass
+@dataclass(slots=True)
 class WorkerCancelledEvent(WorkerEvent):
     """工作线程取消事件"""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent(BaseEvent):
     """错误事件"""
     message: str  # 错误消息
@@ -132,7 +138,7 @@ class ErrorEvent(BaseEvent):
     stack_trace: str = ""  # 堆栈跟踪
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigChangedEvent(BaseEvent):
     """配置变更事件"""
     key: str  # 设置键名
@@ -142,50 +148,50 @@ class ConfigChangedEvent(BaseEvent):
 
 # 新增请求事件数据类
 
-@dataclass
+@dataclass(slots=True)
 class RequestAddTasksEvent(BaseEvent):
     """请求添加任务事件"""
     file_paths: List[str]  # 文件路径列表
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestRemoveTaskEvent(TaskEvent):
     """请求移除任务事件"""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestClearTasksEvent(BaseEvent):
     """请求清空所有任务事件"""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestStartProcessingEvent(BaseEvent):
     """请求开始处理任务事件"""
     model_name: str = ""  # 模型名称，可选
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestCancelProcessingEvent(BaseEvent):
     """请求取消处理任务事件"""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioExtractedEvent(BaseEvent):
     """音频提取完成事件"""
     file_path: str  # 原始文件路径
     audio_path: str  # 提取后的音频路径
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskTimerUpdatedEvent(TaskEvent):
     """任务计时器更新事件"""
     duration: str  # 任务持续时间
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelEvent(BaseEvent):
     """统一的模型事件数据类"""
     event_type: str  # 事件类型，使用EventTypes中的常量
@@ -199,25 +205,25 @@ class ModelEvent(BaseEvent):
     model_path: Optional[str] = None  # 模型路径 (用于MODEL_LOADED)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelDownloadErrorEvent(BaseEvent):
     """模型下载错误事件"""
     model_name: str  # 模型名称
     error: str  # 错误信息
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskAssignedEvent(TaskEvent):
     """任务分配事件，通知转录服务开始处理特定任务"""
     file_path: str  # 文件路径
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionStartedEvent(BaseEvent):
     """全局转录开始事件，包含转录参数信息"""
     parameters: TranscriptionParameters  # 转录参数
 # 新增：单个任务处理开始事件
-@dataclass
+@dataclass(slots=True)
 class TaskStartedEvent(TaskEvent):
     """单个任务处理开始事件"""
     file_path: str  # 文件路径
@@ -225,13 +231,13 @@ class TaskStartedEvent(TaskEvent):
 
 
 
-@dataclass
+@dataclass(slots=True)
 class CudaEnvDownloadStartedEvent(BaseEvent):
     """CUDA环境下载开始事件"""
     app_name: str  # 应用名称
 
 
-@dataclass
+@dataclass(slots=True)
 class CudaEnvDownloadProgressEvent(BaseEvent):
     """CUDA环境下载进度事件"""
     app_name: str  # 应用名称
@@ -239,7 +245,7 @@ class CudaEnvDownloadProgressEvent(BaseEvent):
     message: str  # 进度消息
 
 
-@dataclass
+@dataclass(slots=True)
 class CudaEnvDownloadCompletedEvent(BaseEvent):
     """CUDA环境下载完成事件"""
     app_name: str  # 应用名称
@@ -247,7 +253,7 @@ class CudaEnvDownloadCompletedEvent(BaseEvent):
     error: str = ""  # 错误信息
 
 
-@dataclass
+@dataclass(slots=True)
 class CudaEnvDownloadErrorEvent(BaseEvent):
     """CUDA环境下载错误事件"""
     app_name: str  # 应用名称
@@ -255,13 +261,13 @@ class CudaEnvDownloadErrorEvent(BaseEvent):
     details: Dict[str, Any] = field(default_factory=dict)  # 错误详情
 
 
-@dataclass
+@dataclass(slots=True)
 class CudaEnvInstallStartedEvent(BaseEvent):
     """CUDA环境安装开始事件"""
     app_name: str  # 应用名称
 
 
-@dataclass
+@dataclass(slots=True)
 class CudaEnvInstallProgressEvent(BaseEvent):
     """CUDA环境安装进度事件"""
     app_name: str  # 应用名称
@@ -269,7 +275,7 @@ class CudaEnvInstallProgressEvent(BaseEvent):
     message: str  # 进度消息
 
 
-@dataclass
+@dataclass(slots=True)
 class CudaEnvInstallCompletedEvent(BaseEvent):
     """CUDA环境安装完成事件"""
     app_name: str  # 应用名称
@@ -277,7 +283,7 @@ class CudaEnvInstallCompletedEvent(BaseEvent):
     error: str = ""  # 错误信息
 
 
-@dataclass
+@dataclass(slots=True)
 class CudaEnvInstallErrorEvent(BaseEvent):
     """CUDA环境安装错误事件"""
     app_name: str  # 应用名称
@@ -285,7 +291,7 @@ class CudaEnvInstallErrorEvent(BaseEvent):
     details: Dict[str, Any] = field(default_factory=dict)  # 错误详情
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentStatusEvent(BaseEvent):
     """环境状态事件 - 报告当前环境状态
     
@@ -301,7 +307,7 @@ class DownloadType(Enum):
     ENV = "env"
     BUNDLED = "bundled"
 
-@dataclass
+@dataclass(slots=True)
 class DownloadForTaskEvent(BaseEvent):
     """点击处理后的下载事件"""
     download_type: DownloadType  # 下载类型
@@ -312,6 +318,7 @@ class EventTypes:
     
     # 任务事件
     TASK_ADDED = "task_added"
+    TASKS_ADDED = "tasks_added"  # 批量任务添加事件
     TASK_REMOVED = "task_removed"
     TASK_STATE_CHANGED = "task_state_changed"
     TASK_TIMER_UPDATED = "task_timer_updated"
@@ -393,53 +400,53 @@ class EventTypes:
     DOWNLOAD_FOR_TASK_ERROR = "download_for_task_error"
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationEvent(BaseEvent):
     """通知事件基类"""
     title: str  # 标题
     content: str  # 内容
 
-@dataclass
+@dataclass(slots=True)
 class NotificationInfoEvent(NotificationEvent):
     """信息通知事件"""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class NotificationSuccessEvent(NotificationEvent):
     """成功通知事件"""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class NotificationWarningEvent(NotificationEvent):
     """警告通知事件"""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class NotificationErrorEvent(NotificationEvent):
     """错误通知事件"""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class FilesDroppedEvent(BaseEvent):
     """文件拖放事件"""
     file_paths: List[str]  # 文件路径列表
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionProcessInfoEvent(TaskEvent):
     """统一的转录进度与文本事件数据"""
     process_text: str  # 当前处理的文本片段
     progress: float  # 当前任务进度 (0-1)
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioInfoReadyEvent(TaskEvent):
     """音频信息获取成功事件"""
     file_path: str # 新增
     audio_info: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioInfoFailedEvent(TaskEvent):
     """音频信息获取失败事件"""
     file_path: str # 新增
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+UI事件中继 - 将面向界面的事件总线事件转换为Qt信号
+界面组件通过 Qt.QueuedConnection 连接这些信号，由Qt负责线程调度，
+接收对象销毁时连接会自动断开
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+from core.events.event_types import EventTypes
+
+
+class UiEventRelay(QObject):
+    """UI事件中继，作为事件总线上这些事件的唯一订阅者"""
+
+    # 转录事件
+    transcription_started = Signal(object)
+    transcription_error = Signal(object)
+
+    # 通知事件
+    notification_info = Signal(object)
+    notification_success = Signal(object)
+    notification_warning = Signal(object)
+    notification_error = Signal(object)
+
+    def __init__(self, event_bus):
+        """初始化UI事件中继
+
+        Args:
+            event_bus: 事件总线实例
+        """
+        super().__init__()
+
+        # 事件总线只需订阅一次，后续由信号分发给各界面组件
+        event_bus.subscribe_many({
+            EventTypes.TRANSCRIPTION_STARTED: self.transcription_started.emit,
+            EventTypes.TRANSCRIPTION_ERROR: self.transcription_error.emit,
+            EventTypes.NOTIFICATION_INFO: self.notification_info.emit,
+            EventTypes.NOTIFICATION_SUCCESS: self.notification_success.emit,
+            EventTypes.NOTIFICATION_WARNING: self.notification_warning.emit,
+            EventTypes.NOTIFICATION_ERROR: self.notification_error.emit,
+        })
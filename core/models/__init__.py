@@ -15,7 +15,7 @@ from core.models.error_model import ErrorInfo, ErrorCategory, ErrorPriority
 from core.models.model_data import ModelData, ModelSize
 
 # 导入任务模型
-from core.models.task_model import Task, ProcessStatus
+from core.models.task_model import Task, ProcessStatus, STATUS_DISPLAY_KEYS
 
 # 导入转录模型
 from core.models.transcription_model import (
@@ -31,7 +31,7 @@ __all__ = [
     'NotificationContent', 'NotificationTitle',
     'ErrorInfo', 'ErrorCategory', 'ErrorPriority',
     'ModelData', 'ModelSize',
-    'Task', 'ProcessStatus',
+    'Task', 'ProcessStatus', 'STATUS_DISPLAY_KEYS',
     'TranscriptionSegment', 'TranscriptionResult', 
     'TranscriptionError', 'TranscriptionParameters',
     'AppConfig'
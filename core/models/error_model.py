@@ -34,7 +34,7 @@ class ErrorPriority(Enum):
     DEBUG = auto()     # 调试级别错误，主要用于开发
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorInfo:
     """错误信息数据类"""
     message: str
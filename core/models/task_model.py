@@ -33,13 +33,12 @@ class ProcessStatus(Enum):
         Returns:
             str: 状态键 (小写枚举名称)
         """
-        if not isinstance(status, cls):
-            # 对于无效状态，可以返回一个默认键或引发错误
-            # 这里返回 'waiting' 作为默认值
-            return cls.WAITING.name.lower()
-            
-        # 直接返回枚举成员名称的小写形式作为键
-        return status.name.lower()
+        # 查预先生成的状态键表，无效状态返回 'waiting' 作为默认值
+        return STATUS_DISPLAY_KEYS.get(status, "waiting")
+
+
+# 状态到显示键（小写枚举名称）的映射，模块加载时生成一次
+STATUS_DISPLAY_KEYS = {status: status.name.lower() for status in ProcessStatus}
 
 
 class Task:
@@ -608,8 +608,8 @@ class ModelManagementService(QObject):
         logger.info(f"环境状态：Windows={self.environment_info.is_windows}, GPU={self.environment_info.has_gpu}")
         logger.info(f"预编译应用可用: {self.environment_info.whisper_app_available}")
         
-        # 订阅环境状态变更事件
-        event_bus.subscribe(EventTypes.ENVIRONMENT_STATUS_CHANGED, self._handle_environment_status_changed)
+        # 订阅环境状态变更事件（以本服务作为订阅者登记，销毁时一次性取消）
+        event_bus.subscribe(EventTypes.ENVIRONMENT_STATUS_CHANGED, self._handle_environment_status_changed, owner=self)
     
     def _init_model_data(self):
         """初始化模型数据"""
@@ -639,12 +639,13 @@ class ModelManagementService(QObject):
         # 扫描模型
         self.scan_models()
         
-        # 订阅事件 - 处理模型下载完成后触发CUDA环境下载
-        event_bus.subscribe(EventTypes.MODEL_DOWNLOAD_COMPLETED, self._on_model_download_completed)
-        event_bus.subscribe(EventTypes.MODEL_DOWNLOAD_ERROR, self._on_model_download_error)
-        event_bus.subscribe(EventTypes.CUDA_ENV_DOWNLOAD_COMPLETED, self._on_cuda_env_download_completed)
-        # 订阅模型下载请求事件
-        event_bus.subscribe(EventTypes.MODEL_DOWNLOAD_REQUESTED, self._on_model_download_requested)
+        # 订阅事件 - 处理模型下载完成后触发CUDA环境下载，以及模型下载请求事件
+        event_bus.subscribe_many({
+            EventTypes.MODEL_DOWNLOAD_COMPLETED: self._on_model_download_completed,
+            EventTypes.MODEL_DOWNLOAD_ERROR: self._on_model_download_error,
+            EventTypes.CUDA_ENV_DOWNLOAD_COMPLETED: self._on_cuda_env_download_completed,
+            EventTypes.MODEL_DOWNLOAD_REQUESTED: self._on_model_download_requested,
+        }, owner=self)
     
     def _on_model_download_completed(self, event_data: ModelEvent): # 添加类型提示
         """模型下载完成事件处理 (仅处理成功情况)
@@ -1442,14 +1443,10 @@ class ModelManagementService(QObject):
     def __del__(self):
         """对象销毁时的清理操作"""
         try:
-            # 取消订阅环境变更事件
-            event_bus.unsubscribe(EventTypes.ENVIRONMENT_STATUS_CHANGED, self._handle_environment_status_changed)
-            # 取消订阅模型事件
-            event_bus.unsubscribe(EventTypes.MODEL_DOWNLOAD_COMPLETED, self._on_model_download_completed)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_DOWNLOAD_COMPLETED, self._on_cuda_env_download_completed)
-            event_bus.unsubscribe(EventTypes.MODEL_DOWNLOAD_REQUESTED, self._on_model_download_requested)
-        except:
-            # 忽略可能的异常
+            # 取消本服务登记的全部事件订阅
+            event_bus.unsubscribe_all(self)
+        except (AttributeError, RuntimeError):
+            # 解释器退出时模块全局变量可能已被清理，或事件总线的Qt对象已被销毁
             pass
             
     def _publish_cuda_download_error_event(self, error_msg: str):
@@ -8,7 +8,9 @@
 """
 
 import os
+import stat
 import time
+from collections import Counter
 from typing import Dict, List, Optional, Tuple, Any, Set
 from loguru import logger
 from PySide6.QtCore import QObject, Signal, QTimer
@@ -18,15 +20,14 @@ from core.models.error_model import ErrorCategory, ErrorInfo, ErrorPriority
 from core.models.task_model import Task, ProcessStatus
 from core.events import (
     event_bus, EventTypes, 
-    TaskStateChangedEvent, TaskAddedEvent, TaskRemovedEvent,
+    TaskStateChangedEvent, TaskAddedEvent, TasksAddedEvent, TaskRemovedEvent,
     RequestAddTasksEvent, RequestRemoveTaskEvent, RequestClearTasksEvent,
     RequestStartProcessingEvent, RequestCancelProcessingEvent,
     TranscriptionProgressEvent, TranscriptionCompletedEvent, TranscriptionErrorEvent,
     TaskTimerUpdatedEvent, TaskAssignedEvent
 )
 from core.services.audio_service import AudioService
-from core.utils import file_utils # 导入整个file_utils模块
-from core.utils.file_utils import is_supported_media_file, FileSystemUtils, get_files_from_folder # 保持原有导入，但现在可以直接使用file_utils.get_file_extension
+from core.utils.file_utils import is_supported_media_file, FileSystemUtils, get_media_files_from_folder
 from core.services.config_service import ConfigService
 
 class TaskService(QObject):
@@ -51,6 +52,8 @@ class TaskService(QObject):
         # 任务字典和计数器
         self.tasks: Dict[str, Task] = {}
         self.task_counter = 1  # 任务计数器
+        # 各状态的任务数量，随任务添加、移除和状态变更增量维护
+        self._status_counts: Counter = Counter()
         
         # 使用依赖注入
         self.config_service = config_service
@@ -244,6 +247,7 @@ class TaskService(QObject):
         
         # 添加到任务列表
         self.tasks[task_id] = task
+        self._status_counts[task.status] += 1
         
         # 发布任务添加事件
         file_name = Path(file_path).name
@@ -268,7 +272,8 @@ class TaskService(QObject):
         """
         if task_id in self.tasks:
             # 删除之前的任务状态
-            self.tasks.pop(task_id)
+            task = self.tasks.pop(task_id)
+            self._status_counts[task.status] -= 1
             
             # 发布任务移除事件
             event_data = TaskRemovedEvent(task_id=task_id)
@@ -300,7 +305,7 @@ class TaskService(QObject):
         
         # 更新状态
         previous_status = task.status
-        task.status = status
+        self._set_task_status(task, status)
         
         # 更新进度
         if progress is not None:
@@ -383,6 +388,33 @@ class TaskService(QObject):
         
         return active_tasks
     
+    def _set_task_status(self, task: Task, status: ProcessStatus):
+        """设置任务状态并同步各状态的任务数量
+        
+        Args:
+            task: 任务对象
+            status: 新状态
+        """
+        self._status_counts[task.status] -= 1
+        self._status_counts[status] += 1
+        task.status = status
+    
+    def get_active_count(self) -> int:
+        """获取活动任务数量
+        
+        Returns:
+            int: 活动任务数量
+        """
+        return sum(self._status_counts[status] for status in Task.ACTIVE_STATUSES)
+    
+    def get_pending_count(self) -> int:
+        """获取待处理任务数量
+        
+        Returns:
+            int: 待处理任务数量
+        """
+        return self._status_counts[ProcessStatus.WAITING]
+    
     def get_pending_tasks(self) -> List[Tuple[str, str]]:
         """获取所有待处理的任务
         
@@ -458,24 +490,21 @@ class TaskService(QObject):
         
         return active_tasks
 
-    def _add_task(self, file_path: str) -> str:
-        """添加单个任务（私有方法）
+    def _add_task(self, file_path: str) -> Optional[TaskAddedEvent]:
+        """添加单个任务（私有方法），不发布事件
+        
+        文件路径来自 _collect_valid_files，已确认存在，这里不再重复检查
         
         Args:
             file_path: 文件路径
             
         Returns:
-            str: 任务ID，如果添加失败则返回空字符串
+            Optional[TaskAddedEvent]: 任务添加事件数据，如果添加失败则返回None
         """
-        # 验证文件路径
-        if not os.path.exists(file_path):
-            logger.warning(f"文件不存在: {file_path}")
-            return ""
-        
         # 验证文件类型
         if not is_supported_media_file(file_path):
             logger.warning(f"不支持的文件类型: {file_path}")
-            return ""
+            return None
         
         # 生成任务ID
         task_id = f"task_{self.task_counter}"
@@ -489,20 +518,17 @@ class TaskService(QObject):
 
         # 保存任务
         self.tasks[task_id] = task
+        self._status_counts[task.status] += 1
         
         # 获取文件名用于日志和事件
         file_name = FileSystemUtils.get_file_name(file_path)
         
-        # 发布任务添加事件
-        event_data = TaskAddedEvent(
+        logger.info(f"添加任务: {file_name}")
+        return TaskAddedEvent(
             task_id=task_id,
             file_path=absolute_file_path, # 使用绝对路径
             file_name=file_name
         )
-        event_bus.publish(EventTypes.TASK_ADDED, event_data)
-        
-        logger.info(f"添加任务: {file_name}")
-        return task_id
     
     def add_tasks(self, file_paths: List[str]) -> List[str]:
         """批量添加任务
@@ -517,13 +543,17 @@ class TaskService(QObject):
         valid_files = self._collect_valid_files(file_paths)
         
         # 直接添加所有有效文件
-        added_task_ids = []
+        added_events = []
         for file_path in valid_files:
-            task_id = self._add_task(file_path)
-            if task_id:
-                added_task_ids.append(task_id)
+            event_data = self._add_task(file_path)
+            if event_data:
+                added_events.append(event_data)
         
-        return added_task_ids
+        # 整批只发布一次事件，界面一次性插入所有行
+        if added_events:
+            event_bus.publish(EventTypes.TASKS_ADDED, TasksAddedEvent(tasks=added_events))
+        
+        return [event_data.task_id for event_data in added_events]
     
     def _collect_valid_files(self, paths: List[str]) -> List[str]:
         """收集所有有效的文件路径
@@ -536,9 +566,6 @@ class TaskService(QObject):
         """
         valid_files = []
         
-        # 获取支持的文件格式
-        supported_extensions = self.audio_service.get_supported_formats()
-        
         # 使用队列进行迭代，避免递归
         from collections import deque
         queue = deque(paths)
@@ -546,17 +573,19 @@ class TaskService(QObject):
         while queue:
             path = queue.popleft()
             
-            # 跳过不存在的路径
-            if not os.path.exists(path):
+            # 每个路径只 stat 一次，同时判断是否存在和路径类型
+            try:
+                mode = os.stat(path).st_mode
+            except (OSError, ValueError):
                 logger.debug(f"路径不存在，已忽略: {path}")
                 continue
             
             # 如果是文件夹，获取其中的所有文件和子文件夹
-            if os.path.isdir(path):
+            if stat.S_ISDIR(mode):
                 logger.debug(f"检测到文件夹: {path}")
                 try:
                     # 直接获取文件夹中支持的文件
-                    folder_files = get_files_from_folder(path, supported_extensions)
+                    folder_files = get_media_files_from_folder(path)
                     valid_files.extend(folder_files)
                     logger.debug(f"从文件夹添加了 {len(folder_files)} 个文件: {path}")
                 except Exception as e:
@@ -571,9 +600,9 @@ class TaskService(QObject):
                             user_visible=False  # 这是内部错误，不需要显示给用户
                         )
             # 如果是文件，检查是否支持
-            elif os.path.isfile(path):
-                ext = file_utils.get_file_extension(path) # 使用file_utils中的方法获取不带点的扩展名
-                if ext in supported_extensions:
+            elif stat.S_ISREG(mode):
+                # 使用预先构建的扩展名集合判断
+                if is_supported_media_file(path):
                     valid_files.append(path)
                     logger.debug(f"添加有效文件: {path}")
                 else:
@@ -992,7 +1021,7 @@ class TaskService(QObject):
             logger.info(f"任务状态变更: {task_id} - {previous_status.name} -> {status.name}")
         
         # 更新状态
-        task.status = status
+        self._set_task_status(task, status)
         
         # 更新输出路径（如果提供）
         if output_path:
@@ -105,36 +105,29 @@ class TranscriptionService(QObject):
         
     def _subscribe_to_events(self):
         """订阅事件总线事件"""
-        # 订阅工作线程进度事件
-        
-        # 订阅新的工作线程结束事件
-        event_bus.subscribe(EventTypes.WORKER_COMPLETED, self._handle_worker_completed)
-        event_bus.subscribe(EventTypes.WORKER_FAILED, self._handle_worker_failed)
-        event_bus.subscribe(EventTypes.WORKER_CANCELLED, self._handle_worker_cancelled)
-        
-        # 订阅请求开始处理事件
-        event_bus.subscribe(EventTypes.REQUEST_START_PROCESSING, self._handle_request_start_processing)
-        
-        # 订阅请求取消处理事件
-        event_bus.subscribe(EventTypes.REQUEST_CANCEL_PROCESSING, self._handle_request_cancel_processing)
-        
-        # 订阅任务分配事件
-        event_bus.subscribe(EventTypes.TASK_ASSIGNED, self._handle_task_assigned)
-        
-        # 订阅CUDA环境下载完成事件
-        event_bus.subscribe(EventTypes.CUDA_ENV_DOWNLOAD_COMPLETED, self._handle_cuda_env_download_completed)
-        
-        # 订阅模型加载完成事件
-        event_bus.subscribe(EventTypes.MODEL_LOADED, self._handle_model_loaded)
-
-        # 订阅配置变更事件
-        event_bus.subscribe(EventTypes.CONFIG_CHANGED, self._on_config_changed)
-        
-        # 订阅环境状态变更事件
-        event_bus.subscribe(EventTypes.ENVIRONMENT_STATUS_CHANGED, self._handle_environment_status_changed)
-        # 新增订阅
-        event_bus.subscribe(EventTypes.AUDIO_INFO_READY, self._handle_audio_info_ready)
-        event_bus.subscribe(EventTypes.AUDIO_INFO_FAILED, self._handle_audio_info_failed)
+        # 一次性批量订阅，以本服务作为订阅者登记，处理函数只保存在事件总线中
+        event_bus.subscribe_many({
+            # 工作线程结束事件
+            EventTypes.WORKER_COMPLETED: self._handle_worker_completed,
+            EventTypes.WORKER_FAILED: self._handle_worker_failed,
+            EventTypes.WORKER_CANCELLED: self._handle_worker_cancelled,
+            # 请求开始/取消处理事件
+            EventTypes.REQUEST_START_PROCESSING: self._handle_request_start_processing,
+            EventTypes.REQUEST_CANCEL_PROCESSING: self._handle_request_cancel_processing,
+            # 任务分配事件
+            EventTypes.TASK_ASSIGNED: self._handle_task_assigned,
+            # CUDA环境下载完成事件
+            EventTypes.CUDA_ENV_DOWNLOAD_COMPLETED: self._handle_cuda_env_download_completed,
+            # 模型加载完成事件
+            EventTypes.MODEL_LOADED: self._handle_model_loaded,
+            # 配置变更事件
+            EventTypes.CONFIG_CHANGED: self._on_config_changed,
+            # 环境状态变更事件
+            EventTypes.ENVIRONMENT_STATUS_CHANGED: self._handle_environment_status_changed,
+            # 音频信息事件
+            EventTypes.AUDIO_INFO_READY: self._handle_audio_info_ready,
+            EventTypes.AUDIO_INFO_FAILED: self._handle_audio_info_failed,
+        }, owner=self)
     
     
     # --- 新的事件处理方法 ---
@@ -916,18 +909,8 @@ class TranscriptionService(QObject):
     def __del__(self):
         """对象销毁时取消事件订阅"""
         try:
-            # 取消订阅所有事件
-            event_bus.unsubscribe(EventTypes.WORKER_COMPLETED, self.handle_worker_completed)
-            event_bus.unsubscribe(EventTypes.REQUEST_START_PROCESSING, self._handle_request_start_processing)
-            event_bus.unsubscribe(EventTypes.REQUEST_CANCEL_PROCESSING, self._handle_request_cancel_processing)
-            event_bus.unsubscribe(EventTypes.TASK_ASSIGNED, self._handle_task_assigned)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_DOWNLOAD_COMPLETED, self._handle_cuda_env_download_completed)
-            event_bus.unsubscribe(EventTypes.MODEL_LOADED, self._handle_model_loaded)
-            event_bus.unsubscribe(EventTypes.CONFIG_CHANGED, self._on_config_changed)
-            event_bus.unsubscribe(EventTypes.ENVIRONMENT_STATUS_CHANGED, self._handle_environment_status_changed)
-            # 新增取消订阅
-            event_bus.unsubscribe(EventTypes.AUDIO_INFO_READY, self._handle_audio_info_ready)
-            event_bus.unsubscribe(EventTypes.AUDIO_INFO_FAILED, self._handle_audio_info_failed)
+            # 取消本服务登记的全部事件订阅
+            event_bus.unsubscribe_all(self)
         except Exception as e:
             # 忽略可能的异常
             logger.debug(f"取消事件订阅时发生异常: {str(e)}")
@@ -11,10 +11,19 @@ import sys # Added for PyInstaller _MEIPASS check
 import subprocess
 from typing import List, Set, Optional
 from loguru import logger
-from pathlib import Path
 
 from core.models.config import SUPPORTED_AUDIO_FORMATS, SUPPORTED_VIDEO_FORMATS, SUPPORTED_EXPORT_FORMATS
 
+# 支持的媒体扩展名集合（小写、不带点），模块加载时构建一次
+_SUPPORTED_AUDIO_EXTENSIONS = frozenset(ext.lower() for ext in SUPPORTED_AUDIO_FORMATS)
+_SUPPORTED_VIDEO_EXTENSIONS = frozenset(ext.lower() for ext in SUPPORTED_VIDEO_FORMATS)
+_SUPPORTED_MEDIA_EXTENSIONS = _SUPPORTED_AUDIO_EXTENSIONS | _SUPPORTED_VIDEO_EXTENSIONS
+
+# 媒体文件对话框的默认过滤器
+_MEDIA_FILE_FILTER = "音频/视频文件 ({});;所有文件 (*)".format(
+    ' '.join(f"*.{ext}" for ext in SUPPORTED_AUDIO_FORMATS + SUPPORTED_VIDEO_FORMATS)
+)
+
 def get_resource_path(relative_path: str) -> str:
     """获取资源的绝对路径，兼容开发环境和打包后的环境。"""
     try:
@@ -38,7 +47,7 @@ def get_file_extension(file_path: str) -> str:
     Returns:
         str: 文件扩展名（小写，不带点）
     """
-    return Path(file_path).suffix.lower().lstrip('.')
+    return os.path.splitext(file_path)[1][1:].lower()
 
 
 def is_supported_media_file(file_path: str) -> bool:
@@ -50,7 +59,7 @@ def is_supported_media_file(file_path: str) -> bool:
     Returns:
         bool: 是否支持
     """
-    return is_supported_audio_file(file_path) or is_supported_video_file(file_path)
+    return get_file_extension(file_path) in _SUPPORTED_MEDIA_EXTENSIONS
 
 
 def is_supported_video_file(file_path: str) -> bool:
@@ -62,7 +71,7 @@ def is_supported_video_file(file_path: str) -> bool:
     Returns:
         bool: 是否支持
     """
-    return get_file_extension(file_path) in SUPPORTED_VIDEO_FORMATS
+    return get_file_extension(file_path) in _SUPPORTED_VIDEO_EXTENSIONS
 
 
 def is_supported_audio_file(file_path: str) -> bool:
@@ -74,7 +83,7 @@ def is_supported_audio_file(file_path: str) -> bool:
     Returns:
         bool: 是否支持
     """
-    return get_file_extension(file_path) in SUPPORTED_AUDIO_FORMATS
+    return get_file_extension(file_path) in _SUPPORTED_AUDIO_EXTENSIONS
 
 def is_supported_export_file(file_path: str) -> bool:
     """检查文件是否是支持的导出格式
@@ -133,24 +142,46 @@ def get_files_from_folder(folder_path: str, extensions: List[str] = None) -> Lis
     Returns:
         List[str]: 文件路径列表
     """
-    files = []
+    # 扩展名统一为小写、不带点的集合，兼容带点和不带点两种写法
+    if extensions:
+        extensions = {ext.lower().lstrip('.') for ext in extensions}
     
-    # 检查文件夹是否存在
-    if not os.path.exists(folder_path) or not os.path.isdir(folder_path):
-        return files
+    return _walk_files(folder_path, extensions)
+
+
+def get_media_files_from_folder(folder_path: str) -> List[str]:
+    """获取文件夹中所有支持的媒体文件
+    
+    Args:
+        folder_path: 文件夹路径
+        
+    Returns:
+        List[str]: 媒体文件路径列表
+    """
+    # 直接使用预先构建的扩展名集合，无需再规范化
+    return _walk_files(folder_path, _SUPPORTED_MEDIA_EXTENSIONS)
+
+
+def _walk_files(folder_path: str, extensions: Optional[Set[str]]) -> List[str]:
+    """递归获取文件夹中扩展名匹配的文件
     
-    # 遍历文件夹
+    Args:
+        folder_path: 文件夹路径
+        extensions: 小写、不带点的扩展名集合，为空时获取所有文件
+        
+    Returns:
+        List[str]: 文件路径列表
+    """
+    files = []
+    
+    # 遍历文件夹（os.walk 基于 os.scandir，目录项类型来自缓存，无需逐个 stat；
+    # 文件夹不存在或不可读时不产生任何结果）
     for root, _, filenames in os.walk(folder_path):
         for filename in filenames:
-            file_path = os.path.join(root, filename)
-            
             # 如果指定了扩展名，则只获取指定扩展名的文件
-            if extensions:
-                file_ext = os.path.splitext(filename)[1].lower()
-                if file_ext in extensions:
-                    files.append(file_path)
-            else:
-                files.append(file_path)
+            if extensions and os.path.splitext(filename)[1][1:].lower() not in extensions:
+                continue
+            files.append(os.path.join(root, filename))
     
     return files
 
@@ -335,16 +366,12 @@ class FileSystemUtils:
         """
         from PySide6.QtWidgets import QFileDialog
         
-        # 如果没有指定扩展名，则使用所有支持的媒体格式
+        # 如果没有指定扩展名，则使用预先构建的媒体格式过滤器
         if extensions is None:
-            extensions = get_supported_media_extensions()
-        
-        # 构建支持的文件格式过滤器
-        format_list = []
-        for fmt in extensions:
-            format_list.append(f"*{fmt}")
-        
-        filter_str = f"音频/视频文件 ({' '.join(format_list)});;所有文件 (*)"
+            filter_str = _MEDIA_FILE_FILTER
+        else:
+            format_list = ' '.join(f"*.{fmt.lstrip('.')}" for fmt in extensions)
+            filter_str = f"音频/视频文件 ({format_list});;所有文件 (*)"
         
         # 打开文件对话框
         return QFileDialog.getOpenFileNames(
@@ -386,9 +413,6 @@ def files_filter(paths: List[str]) -> List[str]:
     """
     logger.debug(f"files_filter被调用，路径数量: {len(paths)}")
     
-    # 获取支持的扩展名
-    supported_extensions = get_supported_media_extensions()
-    
     # 结果文件列表
     valid_files = []
     
@@ -401,8 +425,7 @@ def files_filter(paths: List[str]) -> List[str]:
             
         # 如果是文件，直接检查扩展名
         if os.path.isfile(path):
-            ext = get_file_extension(path)
-            if ext in supported_extensions:
+            if is_supported_media_file(path):
                 logger.debug(f"有效文件: {path}")
                 return [path]
             else:
@@ -411,7 +434,7 @@ def files_filter(paths: List[str]) -> List[str]:
         # 如果是目录，递归获取目录中所有符合条件的文件
         elif os.path.isdir(path):
             logger.debug(f"处理文件夹: {path}")
-            folder_files = get_files_from_folder(path, supported_extensions)
+            folder_files = get_media_files_from_folder(path)
             logger.debug(f"从文件夹 {path} 获取到 {len(folder_files)} 个有效文件")
             return folder_files
         else:
@@ -11,7 +11,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QPainter, QColor, QPen
 from PySide6.QtWidgets import QVBoxLayout, QLabel
 
-from qfluentwidgets import CardWidget, FluentIcon, TitleLabel, BodyLabel
+from qfluentwidgets import CardWidget, FluentIcon, TitleLabel, BodyLabel, isDarkTheme
 from dependency_injector.wiring import Provide, inject
 from loguru import logger
 
@@ -25,6 +25,27 @@ from core.models.error_model import ErrorCategory, ErrorPriority
 from core.events import event_bus, EventTypes, RequestAddTasksEvent, FilesDroppedEvent
 
 
+# 图标像素图缓存，按 (图标, 是否深色主题, 尺寸) 区分，避免每次鼠标进出都重新渲染SVG
+_ICON_PIXMAP_CACHE = {}
+
+
+def _icon_pixmap(icon: FluentIcon, size: int):
+    """获取当前主题下图标的像素图，带缓存
+    
+    Args:
+        icon: Fluent 图标
+        size: 像素图边长
+        
+    Returns:
+        QPixmap: 图标像素图
+    """
+    key = (icon, isDarkTheme(), size)
+    pixmap = _ICON_PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = _ICON_PIXMAP_CACHE[key] = icon.icon().pixmap(size, size)
+    return pixmap
+
+
 class DropArea(CardWidget):
     """通用拖放区域，支持文件和文件夹拖放"""
     
@@ -113,7 +134,7 @@ class DropArea(CardWidget):
     
     def _update_icon(self):
         """更新图标，根据当前主题设置合适的图标"""
-        self.icon_label.setPixmap(FluentIcon.FOLDER_ADD.icon().pixmap(64, 64))
+        self.icon_label.setPixmap(_icon_pixmap(FluentIcon.FOLDER_ADD, 64))
     
     def _process_selected_paths(self, paths, last_directory_update=None):
         """处理选择的文件或文件夹路径
@@ -229,8 +250,7 @@ class DropArea(CardWidget):
                 # 检查是否是文件或目录
                 if os.path.isfile(file_path):
                     # 如果是文件，检查是否有效
-                    ext = file_utils.get_file_extension(file_path)
-                    if ext in file_utils.get_supported_media_extensions():
+                    if file_utils.is_supported_media_file(file_path):
                         has_valid_item = True
                         break
                 elif os.path.isdir(file_path):
@@ -95,9 +95,14 @@ class ModelSelectionCard(ComboBoxSettingCard):
         # 连接下拉框变更信号
         self.comboBox.currentTextChanged.connect(self._on_model_changed)
         
-        # 订阅模型数据变更事件
-        event_bus.subscribe(EventTypes.MODEL_DATA_CHANGED, self._on_model_data_changed)
-        event_bus.subscribe(EventTypes.CUDA_ENV_INSTALL_COMPLETED, self._on_cuda_env_install_completed)
+        # 订阅模型数据变更事件，以本卡片作为订阅者登记，处理函数只保存在事件总线中
+        event_bus.subscribe_many({
+            EventTypes.MODEL_DATA_CHANGED: self._on_model_data_changed,
+            EventTypes.CUDA_ENV_INSTALL_COMPLETED: self._on_cuda_env_install_completed,
+        }, owner=self)
+        
+        # 卡片销毁时取消订阅（回调不绑定 self，保证销毁过程中仍可执行），Qt信号连接由Qt自动断开
+        self.destroyed.connect(lambda *_, owner=self: event_bus.unsubscribe_all(owner))
 
         # 初始化 UI
         self.init_ui()
@@ -239,17 +244,3 @@ class ModelSelectionCard(ComboBoxSettingCard):
     def _on_cuda_env_install_completed(self, event):
         """CUDA环境安装完成事件"""
         self.update_ui(self.current_model, self.model_service.get_model_data(self.current_model))
-    
-    def __del__(self):
-        """组件销毁时清理资源"""
-        try:
-            # 断开信号连接
-            self.downloadButton.clicked.disconnect()
-            self.syncButton.clicked.disconnect()
-            self.comboBox.currentTextChanged.disconnect()
-            
-            # 取消事件订阅
-            event_bus.unsubscribe(EventTypes.MODEL_DATA_CHANGED, self._on_model_data_changed)
-        except:
-            # 忽略可能的异常
-            pass 
\ No newline at end of file
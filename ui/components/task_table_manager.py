@@ -59,20 +59,17 @@ class TaskTableManager(QObject):
         # 清空表格
         self.clear_table()
         
-        # 获取所有任务并添加到表格
+        # 获取所有任务并一次性添加到表格
         all_tasks = self.task_service.get_all_tasks()
-        for task_id, task in all_tasks.items():
-            file_path = task.file_path
-            status_text = self._get_status_display_text(task.status)
-            duration = self.task_service.get_task_duration(task_id)
-            
-            # 添加到表格
-            self._add_task_to_table(
-                task_id, 
-                file_path,
-                status_text,
-                duration
+        self.add_tasks_to_table([
+            (
+                task_id,
+                task.file_path,
+                self._get_status_display_text(task.status),
+                self.task_service.get_task_duration(task_id)
             )
+            for task_id, task in all_tasks.items()
+        ])
     
     def _get_status_display_text(self, status: ProcessStatus) -> str:
         """获取状态的显示文本
@@ -116,12 +113,43 @@ class TaskTableManager(QObject):
         Returns:
             int: 添加的行索引
         """
-        # 获取文件名
-        file_name = FileSystemUtils.get_file_name(file_path)
-        
         # 添加到表格
         row = self.table.rowCount()
         self.table.insertRow(row)
+        self._fill_row(row, task_id, file_path, status, duration)
+        
+        return row
+    
+    def add_tasks_to_table(self, rows: List[Tuple[str, str, str, str]]):
+        """批量添加任务到表格，只调整一次行数、重绘一次
+        
+        Args:
+            rows: (任务ID, 文件路径, 状态文本, 时长文本) 列表
+        """
+        if not rows:
+            return
+            
+        start_row = self.table.rowCount()
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(start_row + len(rows))
+            for offset, (task_id, file_path, status, duration) in enumerate(rows):
+                self._fill_row(start_row + offset, task_id, file_path, status, duration)
+        finally:
+            self.table.setUpdatesEnabled(True)
+    
+    def _fill_row(self, row: int, task_id: str, file_path: str, status: str, duration: str):
+        """填充一行任务数据和操作按钮
+        
+        Args:
+            row: 行索引
+            task_id: 任务ID
+            file_path: 文件路径
+            status: 状态文本
+            duration: 时长文本
+        """
+        # 获取文件名
+        file_name = FileSystemUtils.get_file_name(file_path)
         
         # 设置文件名单元格 - 左对齐
         file_item = QTableWidgetItem(file_name)
@@ -141,8 +169,6 @@ class TaskTableManager(QObject):
         
         # 设置操作单元格
         self._create_action_buttons(row, task_id)
-        
-        return row
     
     def _create_action_buttons(self, row: int, task_id: str):
         """创建操作按钮
@@ -5,20 +5,66 @@
 转录查看器 - 负责管理转录文本的显示
 """
 
-import datetime
-from typing import Optional
-import time
+from time import time as _time_now, strftime as _strftime, localtime as _localtime
+from typing import Callable, List, Optional, Sequence, Tuple
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QEvent
 from qfluentwidgets import TextBrowser
-from PySide6.QtGui import QTextCursor
+from PySide6.QtGui import QTextCursor, QTextCharFormat, QColor
 from dependency_injector.wiring import Provide, inject
 from core.containers import AppContainer
 
 from core.models.config import Language
-from core.events.event_types import EventTypes, TranscriptionStartedEvent
+from core.events.event_types import TranscriptionStartedEvent
 from core.models.transcription_model import TranscriptionParameters
-from core.events import event_bus
+from core.events import UiEventRelay
+
+
+# 日志行的颜色
+GRAY_COLOR = "#888888"
+ERR_COLOR = "#d83b01"
+OK_COLOR = "#107c10"
+INFO_COLOR = "#0078d4"
+
+# 一行日志由若干 (文本, 字符格式) 片段组成
+LogLine = Tuple[Tuple[str, QTextCharFormat], ...]
+
+# 时间戳缓存：同一秒内的日志行复用同一个格式化字符串
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def _now_hms() -> str:
+    """获取当前时间的 HH:MM:SS 字符串，按秒缓存
+
+    Returns:
+        str: 格式化后的当前时间
+    """
+    global _last_ts_sec, _last_ts_str
+    s = int(_time_now())
+    if s != _last_ts_sec:
+        _last_ts_str = _strftime("%H:%M:%S", _localtime(s))
+        _last_ts_sec = s
+    return _last_ts_str
+
+
+class _ShowEventFilter(QObject):
+    """在被监视控件显示时触发回调的事件过滤器"""
+    
+    def __init__(self, parent: QObject, on_show: Callable[[], None]):
+        """初始化事件过滤器
+        
+        Args:
+            parent: 被监视的控件，同时作为过滤器的父对象
+            on_show: 控件显示时调用的回调
+        """
+        super().__init__(parent)
+        self._on_show = on_show
+    
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Show:
+            self._on_show()
+        return False
 
 
 class TranscriptViewer:
@@ -27,25 +73,91 @@ class TranscriptViewer:
     @inject
     def __init__(self,
                  text_browser: TextBrowser,
-                 translator: callable = Provide[AppContainer.translation_function]
+                 translator: callable = Provide[AppContainer.translation_function],
+                 ui_event_relay: UiEventRelay = Provide[AppContainer.ui_event_relay]
                  ):
         """初始化转录查看器
         
         Args:
             text_browser: 文本浏览器控件实例
             translator: 翻译函数
+            ui_event_relay: UI事件中继
         """
         self._ = translator # 赋值翻译函数
         self.text_browser = text_browser
+        self.ui_event_relay = ui_event_relay
 
         # 仅允许接收键盘焦点以支持滚动，但不允许鼠标选择
         self.text_browser.setFocusPolicy(Qt.TabFocus)
         
-        # 订阅转录开始事件
-        event_bus.subscribe(EventTypes.TRANSCRIPTION_STARTED, self._handle_transcription_started)
+        # 日志只追加不撤销，关闭撤销栈，避免长时间转录时撤销记录无限增长
+        self.text_browser.document().setUndoRedoEnabled(False)
+
+        # 预先翻译固定的初始消息，避免每个转录片段重复查询 gettext
+        self._initial_map = {
+            zh: self._(zh) for zh in ("正在加载音频并准备转录", "已从视频中提取音频", "正在加载模型并处理音频")
+        }
+        self._initial_values = frozenset(self._initial_map.values())
+        self._audio_info_zh = "音频信息:"
+        self._audio_info_tr = self._("音频信息:")
+
+        # 模型信息头部使用的翻译缓存
+        self._t_cache: dict = {}
+        
+        # 预先翻译所有已知语言的显示名称
+        self._lang_display = {code: self._(f"language_{code}") for code in Language.values()}
+        
+        # 预先创建各类日志行使用的字符格式，写入时直接复用，无需解析HTML
+        self._fmt_plain = QTextCharFormat()
+        self._fmt_gray = self._make_format(GRAY_COLOR)
+        self._fmt_err = self._make_format(ERR_COLOR)
+        self._fmt_ok = self._make_format(OK_COLOR)
+        self._fmt_info = self._make_format(INFO_COLOR)
         
-        # 订阅转录错误事件，在转录日志中显示错误信息
-        event_bus.subscribe(EventTypes.TRANSCRIPTION_ERROR, self._handle_transcription_error)
+        # 文本浏览器不可见时暂存的日志行，在显示时一次性写入
+        self._pending_lines: List[LogLine] = []
+        
+        # append_viewer_text 正在更新的行的起始位置，追加新行或清空后失效
+        self._live_block_position: Optional[int] = None
+        
+        # 文本浏览器显示时写入暂存的日志行
+        self._show_filter = _ShowEventFilter(self.text_browser, self._flush_pending)
+        self.text_browser.installEventFilter(self._show_filter)
+        
+        # 连接转录开始事件，以及转录错误事件（在转录日志中显示错误信息）
+        # 使用队列连接，由Qt调度到界面线程的下一轮事件循环执行
+        self.ui_event_relay.transcription_started.connect(self._handle_transcription_started, Qt.QueuedConnection)
+        self.ui_event_relay.transcription_error.connect(self._handle_transcription_error, Qt.QueuedConnection)
+
+        # 文本浏览器销毁时确定性地断开连接
+        self.text_browser.destroyed.connect(self.close)
+    
+    @staticmethod
+    def _make_format(color: str) -> QTextCharFormat:
+        """创建指定前景色的字符格式
+        
+        Args:
+            color: 颜色值
+            
+        Returns:
+            QTextCharFormat: 字符格式
+        """
+        fmt = QTextCharFormat()
+        fmt.setForeground(QColor(color))
+        return fmt
+    
+    def _line(self, current_time: str, text: str, fmt: QTextCharFormat) -> LogLine:
+        """构建带时间戳前缀的日志行
+        
+        Args:
+            current_time: 当前时间字符串
+            text: 日志文本
+            fmt: 日志文本的字符格式
+            
+        Returns:
+            LogLine: 日志行片段
+        """
+        return (("[" + current_time + "] ", self._fmt_gray), (text, fmt))
     
     def _handle_transcription_started(self, event: TranscriptionStartedEvent):
         """处理转录开始事件
@@ -73,6 +185,22 @@ class TranscriptViewer:
         # 添加错误消息到转录日志
         self.add_error_message(error_message)
     
+    def _t(self, key: str) -> str:
+        """带缓存的翻译查询
+        
+        提取翻译字符串时需为 pybabel 追加关键字参数 -k _t
+        
+        Args:
+            key: 翻译键
+            
+        Returns:
+            str: 翻译后的文本
+        """
+        value = self._t_cache.get(key)
+        if value is None:
+            value = self._t_cache[key] = self._(key)
+        return value
+    
     def _display_model_info(self, params: TranscriptionParameters):
         """显示模型信息
         
@@ -80,35 +208,36 @@ class TranscriptViewer:
             params: 转录参数
         """
         # 获取当前时间
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
+        current_time = _now_hms()
         
         # 语言显示
         language_str = params.language or "auto"
         # language_display = Language.display_name(language_str) # 旧方式
-        # 假设 Language 枚举的 value 是 "auto", "zh_CN", "en" 等
-        lang_translation_key = f"language_{language_str.lower()}"
-        language_display = self._(lang_translation_key) if language_str != "auto" else self._("language_auto")
+        # 已知语言直接查表，未知语言再按翻译键查询
+        language_display = self._lang_display.get(language_str)
+        if language_display is None:
+            language_display = self._t(f"language_{language_str.lower()}")
 
-        task_display = self._("翻译") if params.task == "translate" else self._("转录")
+        task_display = self._t("翻译") if params.task == "translate" else self._t("转录")
         
         # 基本信息
         # start_info = f"<span style='color:#888888;'>[{current_time}]</span> <span style='color:#888888;'>{self._('开始转录处理')}</span>"
         # self.text_browser.append(start_info)
         
         # 基本参数
-        basic_params_text = self._("基本参数: 模型={model_name}, 语言={language_display}, 任务={task_display}, 输出格式={output_format}")
-        basic_params = f"<span style='color:#888888;'>[{current_time}]</span> <span style='color:#888888;'>{basic_params_text.format(model_name=params.model_name, language_display=language_display, task_display=task_display, output_format=params.output_format)}</span>"
-        self.text_browser.append(basic_params)
+        basic_params_text = self._t("基本参数: 模型={model_name}, 语言={language_display}, 任务={task_display}, 输出格式={output_format}")
+        basic_params = self._line(current_time, basic_params_text.format(model_name=params.model_name, language_display=language_display, task_display=task_display, output_format=params.output_format), self._fmt_gray)
         
         # 高级参数
-        advanced_params_text = self._("高级参数: 波束大小={beam_size}, VAD过滤={vad_filter}, 单词时间戳={word_timestamps}, 标点符号={include_punctuation}")
-        advanced_params = f"<span style='color:#888888;'>[{current_time}]</span> <span style='color:#888888;'>{advanced_params_text.format(beam_size=params.beam_size, vad_filter=params.vad_filter, word_timestamps=params.word_timestamps, include_punctuation=params.include_punctuation)}</span>"
-        self.text_browser.append(advanced_params)
+        advanced_params_text = self._t("高级参数: 波束大小={beam_size}, VAD过滤={vad_filter}, 单词时间戳={word_timestamps}, 标点符号={include_punctuation}")
+        advanced_params = self._line(current_time, advanced_params_text.format(beam_size=params.beam_size, vad_filter=params.vad_filter, word_timestamps=params.word_timestamps, include_punctuation=params.include_punctuation), self._fmt_gray)
         
         # 技术参数
-        tech_params_text = self._("技术参数: 转录设备={device}, 计算精度={compute_type}, 温度={temperature}, 条件文本={condition_on_previous_text}, 无语音阈值={no_speech_threshold}")
-        tech_params = f"<span style='color:#888888;'>[{current_time}]</span> <span style='color:#888888;'>{tech_params_text.format(device=params.device, compute_type=params.compute_type, temperature=params.temperature, condition_on_previous_text=params.condition_on_previous_text, no_speech_threshold=params.no_speech_threshold)}</span>"
-        self.text_browser.append(tech_params)
+        tech_params_text = self._t("技术参数: 转录设备={device}, 计算精度={compute_type}, 温度={temperature}, 条件文本={condition_on_previous_text}, 无语音阈值={no_speech_threshold}")
+        tech_params = self._line(current_time, tech_params_text.format(device=params.device, compute_type=params.compute_type, temperature=params.temperature, condition_on_previous_text=params.condition_on_previous_text, no_speech_threshold=params.no_speech_threshold), self._fmt_gray)
+        
+        # 三行参数总是一起出现，在同一个编辑块中写入以减少文档布局次数
+        self._append_and_stick(basic_params, advanced_params, tech_params)
         
     def add_transcript_text(self, text: str, start_time: Optional[float] = None, end_time: Optional[float] = None):
         """添加转录文本
@@ -119,46 +248,62 @@ class TranscriptViewer:
             end_time: 片段结束时间（秒），可选
             task_id: 任务ID，可选
         """
+        display_line = self._transcript_line(text, start_time, end_time)
+        if display_line is None:
+            return
+        
+        # 添加到文本浏览器，仅在用户停留在底部时跟随滚动
+        self._append_and_stick(display_line)
+    
+    def add_transcript_texts(self, texts: Sequence[str]):
+        """批量添加转录文本，所有行在同一个编辑块中写入
+        
+        Args:
+            texts: 转录文本列表
+        """
+        lines = [line for line in map(self._transcript_line, texts) if line is not None]
+        if lines:
+            self._append_and_stick(*lines)
+    
+    def _transcript_line(self, text: str, start_time: Optional[float] = None, end_time: Optional[float] = None) -> Optional[LogLine]:
+        """构建转录文本的日志行
+        
+        Args:
+            text: 转录文本
+            start_time: 片段开始时间（秒），可选
+            end_time: 片段结束时间（秒），可选
+            
+        Returns:
+            Optional[LogLine]: 日志行片段，空白文本返回 None
+        """
+        # 静音处可能产生空白片段，直接跳过
+        if not text or not text.strip():
+            return None
+        
         # 获取当前时间
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
+        current_time = _now_hms()
         
         # 检查是否是初始消息或音频信息
-        # 这些特定的字符串需要被翻译，或者使用更通用的键
-        # 为简化，我们假设这些字符串会作为 msgid 直接出现在 .po 文件中
-        translated_text = text # 默认不翻译，除非是特定消息
-        if "正在加载音频并准备转录" in text:
-            translated_text = self._("正在加载音频并准备转录")
-        elif "已从视频中提取音频" in text:
-            translated_text = self._("已从视频中提取音频")
-        elif "正在加载模型并处理音频" in text:
-            translated_text = self._("正在加载模型并处理音频")
-        elif "音频信息:" in text: # "音频信息:" 本身也可能需要翻译
-            translated_text = text.replace("音频信息:", self._("音频信息:"))
-
+        # 初始消息已在构造时翻译，这里只需一次字典查询
+        translated_text = self._initial_map.get(text)
+        if translated_text is None:
+            translated_text = text # 默认不翻译，除非是特定消息
+            if text.startswith(self._audio_info_zh): # "音频信息:" 前缀需要翻译
+                translated_text = self._audio_info_tr + text[len(self._audio_info_zh):]
 
         is_initial_message = (
-            self._("正在加载音频并准备转录") in translated_text or
-            self._("已从视频中提取音频") in translated_text or
-            self._("正在加载模型并处理音频") in translated_text or
-            self._("音频信息:") in translated_text
+            translated_text in self._initial_values or
+            translated_text.startswith(self._audio_info_tr)
         )
         
         # 格式化转录文本
         if start_time is not None and end_time is not None and not is_initial_message:
             # 添加音频内时间戳（仅对实际转录内容）
-            timestamp_str = f"<span style='color:#888888;'>[{start_time:.2f}s --> {end_time:.2f}s]</span>"
-            display_text = f"<span style='color:#888888;'>[{current_time}]</span> {timestamp_str} {translated_text}"
-        else:
-            # 如果没有提供时间戳或是初始消息，只显示当前时间
-            display_text = f"<span style='color:#888888;'>[{current_time}]</span> <span style='color:#888888;'>{translated_text}</span>"
-        
-        # 添加到文本浏览器
-        self.text_browser.append(display_text)
-        
-        # 滚动到底部
-        self.text_browser.verticalScrollBar().setValue(
-            self.text_browser.verticalScrollBar().maximum()
-        )
+            timestamp_str = f"{start_time:.2f}s --> {end_time:.2f}s"
+            return (("[" + current_time + "] [" + timestamp_str + "] ", self._fmt_gray), (translated_text, self._fmt_plain))
+        
+        # 如果没有提供时间戳或是初始消息，只显示当前时间
+        return self._line(current_time, translated_text, self._fmt_gray)
     
     def add_system_message(self, text: str):
         """添加系统消息
@@ -166,19 +311,17 @@ class TranscriptViewer:
         Args:
             text: 系统消息文本
         """
+        if not text or not text.strip():
+            return
+        
         # 获取当前时间
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
+        current_time = _now_hms()
         
         # 格式化为系统消息
-        display_text = f"<span style='color:#888888;'>[{current_time}]</span> <span style='color:#888888;'>{text}</span>"
-        
-        # 添加到文本浏览器
-        self.text_browser.append(display_text)
+        display_line = self._line(current_time, text, self._fmt_gray)
         
-        # 滚动到底部
-        self.text_browser.verticalScrollBar().setValue(
-            self.text_browser.verticalScrollBar().maximum()
-        )
+        # 添加到文本浏览器，仅在用户停留在底部时跟随滚动
+        self._append_and_stick(display_line)
     
     def add_error_message(self, text: str):
         """添加错误消息
@@ -186,19 +329,17 @@ class TranscriptViewer:
         Args:
             text: 错误消息文本
         """
+        if not text or not text.strip():
+            return
+        
         # 获取当前时间
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
+        current_time = _now_hms()
         
         # 格式化为错误消息
-        display_text = f"<span style='color:#888888;'>[{current_time}]</span> <span style='color:#d83b01;'>{text}</span>"
+        display_line = self._line(current_time, text, self._fmt_err)
         
-        # 添加到文本浏览器
-        self.text_browser.append(display_text)
-        
-        # 滚动到底部
-        self.text_browser.verticalScrollBar().setValue(
-            self.text_browser.verticalScrollBar().maximum()
-        )
+        # 添加到文本浏览器，仅在用户停留在底部时跟随滚动
+        self._append_and_stick(display_line)
     
     def add_success_message(self, text: str):
         """添加成功消息
@@ -207,21 +348,67 @@ class TranscriptViewer:
             text: 成功消息文本
         """
         # 获取当前时间
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
+        current_time = _now_hms()
         
         # 格式化为成功消息
-        display_text = f"<span style='color:#888888;'>[{current_time}]</span> <span style='color:#107c10;'>{text}</span>"
+        display_line = self._line(current_time, text, self._fmt_ok)
         
-        # 添加到文本浏览器
-        self.text_browser.append(display_text)
+        # 添加到文本浏览器，仅在用户停留在底部时跟随滚动
+        self._append_and_stick(display_line)
+    
+    def _append_and_stick(self, *lines: LogLine):
+        """追加日志行，仅在追加前已处于底部时滚动到底部
         
-        # 滚动到底部
-        self.text_browser.verticalScrollBar().setValue(
-            self.text_browser.verticalScrollBar().maximum()
-        )
+        Args:
+            lines: 要追加的日志行
+        """
+        # 不可见时只暂存，避免为看不到的内容做文档布局
+        if not self.text_browser.isVisible():
+            self._pending_lines.extend(lines)
+            # 暂存行数同样受文档最大行数限制，超出部分写入后也会被丢弃
+            max_blocks = self.text_browser.document().maximumBlockCount()
+            if 0 < max_blocks < len(self._pending_lines):
+                del self._pending_lines[:-max_blocks]
+            return
+        
+        self._write_lines(lines)
+    
+    def _write_lines(self, lines: Sequence[LogLine]):
+        """在文档末尾写入日志行，每行一个段落
+        
+        Args:
+            lines: 要写入的日志行
+        """
+        scrollbar = self.text_browser.verticalScrollBar()
+        was_at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        
+        document = self.text_browser.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for line in lines:
+            if not document.isEmpty():
+                cursor.insertBlock()
+            for text, fmt in line:
+                cursor.insertText(text, fmt)
+        cursor.endEditBlock()
+        self._live_block_position = None
+        
+        if was_at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+    
+    def _flush_pending(self):
+        """将不可见期间暂存的日志行写入文本浏览器"""
+        if not self._pending_lines:
+            return
+        
+        pending, self._pending_lines = self._pending_lines, []
+        self._write_lines(pending)
     
     def clear_display(self):
         """清空显示内容"""
+        self._pending_lines.clear()
+        self._live_block_position = None
         self.text_browser.clear()
         
     def append_viewer_text(self, text: str):
@@ -231,14 +418,18 @@ class TranscriptViewer:
             text: 要更新的文本内容
         """
         # 获取当前时间
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
+        current_time = _now_hms()
         
         # 格式化为系统消息
-        display_text = f"<span style='color:#888888;'>[{current_time}]</span> <span style='color:#0078d4;'>{text}</span>"
+        display_line = self._line(current_time, text, self._fmt_info)
+        
+        # 不可见且有暂存内容时，最后一行就是最后一条暂存项
+        if self._pending_lines and not self.text_browser.isVisible():
+            self._pending_lines[-1] = display_line
+            return
         
         # 获取文本浏览器的文档
         document = self.text_browser.document()
-        cursor = self.text_browser.textCursor()
         
         # 保存当前滚动位置
         scrollbar = self.text_browser.verticalScrollBar()
@@ -247,30 +438,33 @@ class TranscriptViewer:
         # 检查是否有内容
         if document.isEmpty():
             # 如果文档为空，直接添加新内容
-            self.text_browser.append(display_text)
+            self._write_lines((display_line,))
             return
         
-        # 移动到文档末尾
-        cursor.movePosition(QTextCursor.End)
+        # 首次更新时记录最后一行的位置，后续更新直接定位到该行
+        if self._live_block_position is None:
+            self._live_block_position = document.lastBlock().position()
         
-        # 更新最后一行
-        cursor.movePosition(QTextCursor.StartOfBlock, QTextCursor.KeepAnchor)
-        cursor.removeSelectedText()
-        cursor.insertHtml(display_text)
+        # 只替换该行内容，替换期间暂停重绘
+        self.text_browser.setUpdatesEnabled(False)
+        try:
+            cursor = QTextCursor(document)
+            cursor.setPosition(self._live_block_position)
+            cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
+            for segment, fmt in display_line:
+                cursor.insertText(segment, fmt)
+        finally:
+            self.text_browser.setUpdatesEnabled(True)
         
         # 如果之前在底部，则保持滚动到底部
         if was_at_bottom:
             scrollbar.setValue(scrollbar.maximum())
 
-    def __del__(self):
-        """析构函数，取消事件订阅"""
-        try:
-            event_bus.unsubscribe(EventTypes.TRANSCRIPTION_STARTED, self._handle_transcription_started)
-            event_bus.unsubscribe(EventTypes.TRANSCRIPTION_ERROR, self._handle_transcription_error)
-        except Exception:
-            pass  # 忽略取消订阅时可能出现的错误
-
     def close(self):
-        """关闭转录查看器，取消事件订阅"""
-        event_bus.unsubscribe(EventTypes.TRANSCRIPTION_STARTED, self._handle_transcription_started)
-        event_bus.unsubscribe(EventTypes.TRANSCRIPTION_ERROR, self._handle_transcription_error)
\ No newline at end of file
+        """关闭转录查看器，断开UI事件连接"""
+        try:
+            self.ui_event_relay.transcription_started.disconnect(self._handle_transcription_started)
+            self.ui_event_relay.transcription_error.disconnect(self._handle_transcription_error)
+        except (RuntimeError, TypeError):
+            pass  # 连接已断开
@@ -5,7 +5,7 @@
 主窗口 - 应用程序的主窗口
 """
 
-from PySide6.QtCore import Signal, Qt, Slot
+from PySide6.QtCore import Signal, Qt, Slot, QTimer
 from dependency_injector.wiring import Provide, inject
 
 from qfluentwidgets import (
@@ -23,7 +23,7 @@ from core.services.task_service import TaskService
 from core.services.config_service import ConfigService
 from core.containers import AppContainer
 from core.models.task_model import ProcessStatus
-from core.events import event_bus, EventTypes, TaskStateChangedEvent, TaskAddedEvent
+from core.events import event_bus, EventTypes, TaskStateChangedEvent, TaskAddedEvent, TasksAddedEvent, UiEventRelay
 from core.models.config import cfg
 
 from loguru import logger
@@ -41,7 +41,8 @@ class MainWindow(FluentWindow):
                  model_service: ModelManagementService = Provide[AppContainer.model_service],
                  notification_service: NotificationService = Provide[AppContainer.notification_service],
                  task_service: TaskService = Provide[AppContainer.task_service],
-                 config_service: ConfigService = Provide[AppContainer.config_service]
+                 config_service: ConfigService = Provide[AppContainer.config_service],
+                 ui_event_relay: UiEventRelay = Provide[AppContainer.ui_event_relay]
                  ):
         """初始化主窗口"""
         super().__init__()
@@ -55,6 +56,10 @@ class MainWindow(FluentWindow):
         self.notification_service = notification_service
         self.task_service = task_service
         self.config_service = config_service
+        self.ui_event_relay = ui_event_relay
+        
+        # 是否已有待执行的切换到任务视图操作（合并批量添加任务时的切换）
+        self._switch_pending = False
         # self._init_services() # 不再需要单独调用
 
         # 初始化UI
@@ -99,40 +104,38 @@ class MainWindow(FluentWindow):
     
     def _init_navigation(self):
         """初始化导航"""
-        # 添加主页
-        self.addSubInterface(self.home_view, FluentIcon.HOME, self._("首页"))
-        
-        # 添加任务视图
-        self.addSubInterface(self.task_view, FluentIcon.DOCUMENT, self._("任务列表"))
-        
-        # 添加分隔线
-        self.navigationInterface.addSeparator()
-
-        # 添加语言切换按钮
-        self.navigationInterface.addItem(
-            routeKey='language_switcher',
-            icon=FluentIcon.LANGUAGE,
-            text=self._('切换语言'),
-            onClick=self._toggle_language,
-            position=NavigationItemPosition.BOTTOM
+        # 导航项: (子界面或路由键, 图标, 文本, 点击回调, 位置)，None 表示分隔线
+        items = (
+            (self.home_view, FluentIcon.HOME, self._("首页"), None, NavigationItemPosition.TOP),
+            (self.task_view, FluentIcon.DOCUMENT, self._("任务列表"), None, NavigationItemPosition.TOP),
+            None,
+            ('language_switcher', FluentIcon.LANGUAGE, self._("切换语言"), self._toggle_language, NavigationItemPosition.BOTTOM),
+            ('theme', FluentIcon.CONSTRACT, self._("深浅主题"), self._toggle_theme, NavigationItemPosition.BOTTOM),
+            (self.settings_view, FluentIcon.SETTING, self._("设置"), None, NavigationItemPosition.BOTTOM),
         )
         
-        # 添加主题切换按钮
-        self.navigationInterface.addItem(
-            routeKey='theme',
-            icon=FluentIcon.CONSTRACT,
-            text=self._('深浅主题'),
-            onClick=self._toggle_theme,
-            position=NavigationItemPosition.BOTTOM
-        )
-        
-        # 添加设置（在底部）
-        self.addSubInterface(
-            self.settings_view,
-            FluentIcon.SETTING,
-            self._("设置"),
-            NavigationItemPosition.BOTTOM
-        )
+        # 批量添加期间暂停重绘，完成后统一刷新一次
+        self.navigationInterface.setUpdatesEnabled(False)
+        try:
+            for item in items:
+                if item is None:
+                    self.navigationInterface.addSeparator()
+                    continue
+                
+                target, icon, text, on_click, position = item
+                if isinstance(target, str):
+                    # 仅作为按钮的导航项
+                    self.navigationInterface.addItem(
+                        routeKey=target,
+                        icon=icon,
+                        text=text,
+                        onClick=on_click,
+                        position=position
+                    )
+                else:
+                    self.addSubInterface(target, icon, text, position)
+        finally:
+            self.navigationInterface.setUpdatesEnabled(True)
     
     def _init_window(self):
         """初始化窗口"""
@@ -151,17 +154,18 @@ class MainWindow(FluentWindow):
     
     def _setup_connections(self):
         """设置信号连接"""
-        # 订阅事件总线事件
-        event_bus.subscribe(EventTypes.TASK_STATE_CHANGED, self.handle_task_state_changed_event)
-        
-        # 订阅任务添加事件
-        event_bus.subscribe(EventTypes.TASK_ADDED, self._handle_task_added_event)
-        
-        # 订阅通知事件
-        event_bus.subscribe(EventTypes.NOTIFICATION_INFO, self._handle_notification_info)
-        event_bus.subscribe(EventTypes.NOTIFICATION_SUCCESS, self._handle_notification_success)
-        event_bus.subscribe(EventTypes.NOTIFICATION_WARNING, self._handle_notification_warning)
-        event_bus.subscribe(EventTypes.NOTIFICATION_ERROR, self._handle_notification_error)
+        # 订阅事件总线事件（任务状态、任务添加、批量任务添加）
+        event_bus.subscribe_many({
+            EventTypes.TASK_STATE_CHANGED: self.handle_task_state_changed_event,
+            EventTypes.TASK_ADDED: self._handle_task_added_event,
+            EventTypes.TASKS_ADDED: self._handle_tasks_added_event,
+        })
+        
+        # 连接通知事件，窗口销毁时Qt自动断开连接
+        self.ui_event_relay.notification_info.connect(self._handle_notification_info, Qt.QueuedConnection)
+        self.ui_event_relay.notification_success.connect(self._handle_notification_success, Qt.QueuedConnection)
+        self.ui_event_relay.notification_warning.connect(self._handle_notification_warning, Qt.QueuedConnection)
+        self.ui_event_relay.notification_error.connect(self._handle_notification_error, Qt.QueuedConnection)
     
     def _display_info(self, title: str, content: str):
         """显示信息通知
@@ -394,6 +398,21 @@ class MainWindow(FluentWindow):
         Args:
             event: 任务添加事件
         """
-        # 切换到任务视图
-        self.switchTo(self.task_view)
-        logger.debug(f"任务添加，切换到任务视图: {event.task_id}")
\ No newline at end of file
+        # 批量添加任务时，100ms 内的多次切换合并为一次
+        if not self._switch_pending:
+            self._switch_pending = True
+            QTimer.singleShot(100, self._do_switch_to_tasks)
+        logger.opt(lazy=True).debug("任务添加，切换到任务视图: {}", lambda: event.task_id)
+    
+    def _handle_tasks_added_event(self, event: TasksAddedEvent):
+        """处理批量任务添加事件，切换到任务视图
+        
+        Args:
+            event: 批量任务添加事件
+        """
+        self._handle_task_added_event(event.tasks[-1])
+    
+    def _do_switch_to_tasks(self):
+        """执行合并后的切换到任务视图操作"""
+        self._switch_pending = False
+        self.switchTo(self.task_view)
\ No newline at end of file
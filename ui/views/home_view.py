@@ -7,7 +7,7 @@
 
 import os
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from dependency_injector.wiring import Provide, inject
 
@@ -65,6 +65,11 @@ class HomeView(QWidget):
         
         # 订阅文件拖放事件
         event_bus.subscribe(EventTypes.FILES_DROPPED, self._on_files_dropped) # 保持订阅
+        # 组件销毁时取消订阅，destroyed 信号由 Qt 在删除对象时确定触发
+        # 使用不绑定 self 的回调，确保对象析构过程中仍能执行
+        self.destroyed.connect(
+            lambda *_, handler=self._on_files_dropped: event_bus.unsubscribe(EventTypes.FILES_DROPPED, handler)
+        )
 
     def _init_ui(self):
         """初始化UI"""
@@ -88,36 +93,32 @@ class HomeView(QWidget):
         Args:
             event: 文件拖放事件对象
         """
-        file_paths = event.file_paths
-        
-        # 更新上次打开的目录
-        if file_paths and file_paths[0]:
-            try:
-                path = os.path.dirname(file_paths[0]) if os.path.isfile(file_paths[0]) else file_paths[0]
-                self.config_service.set_last_directory(path)
-            except Exception as e:
-                logger.error(f"更新目录出错: {e}")
-                # 使用错误处理服务
-                error_info = ErrorInfo(
-                    message=f"更新目录出错: {str(e)}",
-                    category=ErrorCategory.CONFIGURATION,
-                    priority=ErrorPriority.LOW,
-                    code="CONFIG_UPDATE_ERROR",
-                    user_visible=False
-                )
-                self.error_service.handle_error(error_info)
-        
-        # 发布添加任务请求事件
-        event_data = RequestAddTasksEvent(
-            file_paths=file_paths
-        )
-        event_bus.publish(EventTypes.REQUEST_ADD_TASKS, event_data)
+        def _do():
+            file_paths = event.file_paths
+            
+            # 更新上次打开的目录
+            if file_paths and file_paths[0]:
+                try:
+                    # 拖放区域只接受文件，取其所在目录即可，无需访问文件系统
+                    path = os.path.dirname(file_paths[0]) or file_paths[0]
+                    self.config_service.set_last_directory(path)
+                except Exception as e:
+                    logger.error(f"更新目录出错: {e}")
+                    # 使用错误处理服务
+                    error_info = ErrorInfo(
+                        message=f"更新目录出错: {str(e)}",
+                        category=ErrorCategory.CONFIGURATION,
+                        priority=ErrorPriority.LOW,
+                        code="CONFIG_UPDATE_ERROR",
+                        user_visible=False
+                    )
+                    self.error_service.handle_error(error_info)
+            
+            # 发布添加任务请求事件
+            event_data = RequestAddTasksEvent(
+                file_paths=file_paths
+            )
+            event_bus.publish(EventTypes.REQUEST_ADD_TASKS, event_data)
 
-    def __del__(self):
-        """组件销毁时清理资源"""
-        try:
-            # 取消事件订阅
-            event_bus.unsubscribe(EventTypes.FILES_DROPPED, self._on_files_dropped)
-        except:
-            # 忽略可能的异常
-            pass 
\ No newline at end of file
+        # 推迟到下一轮事件循环执行，让事件分发立即返回
+        QTimer.singleShot(0, self, _do)
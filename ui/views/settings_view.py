@@ -5,10 +5,13 @@
 设置视图 - 包含转录设置和界面设置
 """
 
+from enum import Enum
+from functools import partial
 from pathlib import Path
+from typing import NamedTuple, Optional
 from loguru import logger
 
-from PySide6.QtCore import Qt, Signal, QTimer, QSize
+from PySide6.QtCore import Qt, Signal, QTimer, QSize, QSignalBlocker
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QFileDialog, QHBoxLayout, QLabel, QMessageBox
 from dependency_injector.wiring import inject, Provide
 
@@ -37,9 +40,66 @@ from core.events.event_types import (
 )
 from qfluentwidgets import qconfig
 
+# 静态的下拉选项文本，导入时计算一次
+_MODEL_SIZE_CHOICES = tuple(ModelSize.get_display_name(size.value) for size in ModelSize)
+_FORMAT_CHOICES = tuple(fmt.value.upper() for fmt in OutputFormat)
+_COMPUTE_TYPE_CHOICES = tuple(ct.value for ct in ComputeType)
+# CPU 模式下支持 float32 和 int8
+_CPU_COMPUTE_TYPE_CHOICES = (ComputeType.FLOAT32.value, ComputeType.INT8.value)
+# 计算精度文本到枚举成员的映射
+_COMPUTE_TYPE_BY_VALUE = {ct.value: ct for ct in ComputeType}
+
+# 设置视图样式表，仅作用于本视图
+_SETTINGS_QSS = """
+    #settingView, #scrollWidget {
+        background-color: transparent;
+    }
+    QScrollArea {
+        border: none;
+        background-color: transparent;
+    }
+    #settingLabel {
+        font: 33px 'Microsoft YaHei';
+        background-color: transparent;
+    }
+"""
+
+
+class _EnvSnapshot(NamedTuple):
+    """一次CUDA状态UI刷新所需的环境与配置快照"""
+    is_windows: bool
+    has_gpu: bool
+    gpu_name: str
+    can_accel: bool
+    is_downloading: bool
+    is_installing: bool
+    device_pref: str
+
+    @property
+    def gpu_hardware_available(self) -> bool:
+        """是否具备可用的GPU硬件（Windows + GPU）"""
+        return self.is_windows and self.has_gpu
+
+
 class SettingsView(ScrollArea):
     """设置视图"""
     
+    # 事件订阅表：(事件类型, 处理方法名)
+    _SUBSCRIPTIONS = (
+        (EventTypes.MODEL_DOWNLOAD_STARTED, "_on_model_downloading"),
+        (EventTypes.MODEL_DOWNLOAD_PROGRESS, "_on_model_download_progress"),
+        (EventTypes.MODEL_DOWNLOAD_COMPLETED, "_on_download_completed"),
+        (EventTypes.MODEL_DOWNLOAD_ERROR, "_on_model_download_error"),
+        (EventTypes.CUDA_ENV_DOWNLOAD_STARTED, "_on_cuda_env_download_started"),
+        (EventTypes.CUDA_ENV_DOWNLOAD_PROGRESS, "_on_cuda_env_download_progress"),
+        (EventTypes.CUDA_ENV_DOWNLOAD_COMPLETED, "_on_cuda_env_download_completed"),
+        (EventTypes.CUDA_ENV_DOWNLOAD_ERROR, "_on_cuda_env_download_error"),
+        (EventTypes.CUDA_ENV_INSTALL_STARTED, "_on_cuda_env_install_started"),
+        (EventTypes.CUDA_ENV_INSTALL_PROGRESS, "_on_cuda_env_install_progress"),
+        (EventTypes.CUDA_ENV_INSTALL_COMPLETED, "_on_cuda_env_install_completed"),
+        (EventTypes.ENVIRONMENT_STATUS_CHANGED, "_on_environment_status_changed"),
+    )
+    
     @inject
     def __init__(
         self,
@@ -71,6 +131,39 @@ class SettingsView(ScrollArea):
         self.config_service = config_service
         # self._init_services() # 不再需要单独调用
         
+        # 构建卡片时需要读取的配置快照，避免在初始化过程中反复读取配置项
+        self._cfg_snapshot = {
+            key: getattr(cfg, key).value for key in ("output_directory", "vad_filter")
+        }
+        
+        # CUDA环境下载/安装状态，由对应的开始/完成/错误事件维护，创建时从模型服务读取一次
+        active_downloaders = self.model_service.active_downloaders
+        self._cuda_downloading = "cuda_env" in active_downloaders and active_downloaders["cuda_env"].isRunning()
+        self._cuda_installing = "cuda_env_installer" in active_downloaders and active_downloaders["cuda_env_installer"].isRunning()
+        
+        # CUDA状态UI的节流刷新：定时器运行期间的刷新请求合并为一次，刷新频率不超过约12Hz
+        self._cuda_ui_timer = QTimer(self)
+        self._cuda_ui_timer.setInterval(80)
+        self._cuda_ui_timer.setSingleShot(True)
+        self._cuda_ui_timer.timeout.connect(self._update_cuda_status_ui)
+        # 上次写入的设备显示名称和忙碌状态，未变化时不再更新控件
+        self._last_device_display: Optional[str] = None
+        self._last_is_busy: Optional[bool] = None
+        
+        # CUDA进度标签的合并刷新：进度事件只记录最新值，由定时器统一写入标签
+        self._cuda_progress_pending: Optional[str] = None
+        self._cuda_progress_timer = QTimer(self)
+        self._cuda_progress_timer.setInterval(80)
+        self._cuda_progress_timer.setSingleShot(True)
+        self._cuda_progress_timer.timeout.connect(self._flush_cuda_progress)
+        
+        # 计算精度下拉框上次填充时的状态，状态不变时跳过重建
+        self._last_precision_state = None
+        # 上次处理环境状态变更事件时的环境快照
+        self._last_env_snapshot: Optional[_EnvSnapshot] = None
+        # 计算精度选项是否待刷新（视图隐藏期间只记录，显示时再刷新）
+        self._precision_dirty = True
+        
         # 初始化所有设置组
         self._init_groups()
         
@@ -88,22 +181,25 @@ class SettingsView(ScrollArea):
         
         # 初始化CUDA状态UI
         self._update_cuda_status_ui()
-        self._update_compute_precision_options() # Add call here
         self._update_language_card_state(config_service.get_model_name())
         
-        # 订阅模型事件
-        event_bus.subscribe(EventTypes.MODEL_DOWNLOAD_STARTED, self._on_model_downloading)
-        event_bus.subscribe(EventTypes.MODEL_DOWNLOAD_PROGRESS, self._on_model_download_progress)
-        event_bus.subscribe(EventTypes.MODEL_DOWNLOAD_COMPLETED, self._on_download_completed)
-        event_bus.subscribe(EventTypes.MODEL_DOWNLOAD_ERROR, self._on_model_download_error)
-        event_bus.subscribe(EventTypes.CUDA_ENV_DOWNLOAD_STARTED, self._on_cuda_env_download_started)
-        event_bus.subscribe(EventTypes.CUDA_ENV_DOWNLOAD_PROGRESS, self._on_cuda_env_download_progress)
-        event_bus.subscribe(EventTypes.CUDA_ENV_DOWNLOAD_COMPLETED, self._on_cuda_env_download_completed)
-        event_bus.subscribe(EventTypes.CUDA_ENV_DOWNLOAD_ERROR, self._on_cuda_env_download_error)
-        event_bus.subscribe(EventTypes.CUDA_ENV_INSTALL_STARTED, self._on_cuda_env_install_started)
-        event_bus.subscribe(EventTypes.CUDA_ENV_INSTALL_PROGRESS, self._on_cuda_env_install_progress)
-        event_bus.subscribe(EventTypes.CUDA_ENV_INSTALL_COMPLETED, self._on_cuda_env_install_completed)
-        event_bus.subscribe(EventTypes.ENVIRONMENT_STATUS_CHANGED, self._on_environment_status_changed)
+        # 订阅模型事件，以本视图作为订阅者登记，销毁时一次性取消
+        event_bus.subscribe_many(
+            ((event_type, getattr(self, handler_name)) for event_type, handler_name in self._SUBSCRIPTIONS),
+            owner=self
+        )
+        
+        # 视图销毁时取消订阅（静态方法不绑定 self，保证销毁过程中仍可执行）
+        self.destroyed.connect(partial(SettingsView._cleanup_subscriptions, self))
+    
+    @staticmethod
+    def _cleanup_subscriptions(owner, *_):
+        """取消事件订阅，由 destroyed 信号触发
+        
+        Args:
+            owner: 订阅时登记的订阅者
+        """
+        event_bus.unsubscribe_all(owner)
     
     def _init_groups(self):
         """初始化所有设置组"""
@@ -124,13 +220,13 @@ class SettingsView(ScrollArea):
         # 转录设置卡片
         self._init_transcription_cards()
         
-        # 高级设置卡片
-        self._init_advanced_cards()
+        # 高级设置卡片推迟到视图首次显示时创建
+        self._advanced_cards_built = False
     
     def _init_model_cards(self):
         """初始化模型设置卡片"""
         # 模型选择卡片
-        model_choices = [ModelSize.get_display_name(size.value) for size in ModelSize]  # 获取所有模型大小的显示名称
+        model_choices = list(_MODEL_SIZE_CHOICES)  # 所有模型大小的显示名称
         self.model_choice_card = ModelSelectionCard(
             cfg.model_name,
             FluentIcon.LIBRARY,
@@ -155,8 +251,6 @@ class SettingsView(ScrollArea):
     def _init_transcription_cards(self):
         """初始化转录设置卡片"""
         # --- 转录设备卡片 ---
-        # 获取初始环境信息
-        env_info = self.environment_service.get_environment_info()
         # 设置初始设备名称为默认值，将在 _update_cuda_status_ui 中更新
         initial_device_name = "CPU" # This will be updated by _update_cuda_status_ui
 
@@ -173,37 +267,41 @@ class SettingsView(ScrollArea):
         primary_button = PrimaryPushButton(self._("启用CUDA加速"), self.device_info_card)
         primary_button.clicked.connect(self._on_toggle_gpu_preference_clicked) # 修改连接的槽函数
         
-        # 获取卡片布局
+        # 获取卡片布局，批量修改布局期间暂停重绘，结束后统一重新布局
         card_layout = self.device_info_card.hBoxLayout
-        
-        # 获取原有按钮位置
-        button_index = card_layout.indexOf(self.device_info_card.button)
-        
-        # 替换按钮
-        if button_index >= 0:
-            # 移除原有按钮
-            old_button = self.device_info_card.button
-            card_layout.removeWidget(old_button)
-            old_button.deleteLater()
+        self.device_info_card.setUpdatesEnabled(False)
+        try:
+            # 获取原有按钮位置
+            button_index = card_layout.indexOf(self.device_info_card.button)
             
-            # 添加新按钮
-            card_layout.insertWidget(button_index, primary_button)
-            self.device_info_card.button = primary_button
-        
-        # 创建进度标签（用于下载/安装进度）
-        self.cuda_progress_label = QLabel("0%", self)
-        self.cuda_progress_label.setFixedSize(35, 35)
-        self.cuda_progress_label.setAlignment(Qt.AlignCenter)
-        
-        # 在按钮前添加进度标签
-        if button_index >= 0:
-            # 添加空白组件保持一致的间距
-            spacer = QWidget()
-            spacer.setFixedWidth(10)
+            # 替换按钮
+            if button_index >= 0:
+                # 移除原有按钮
+                old_button = self.device_info_card.button
+                card_layout.removeWidget(old_button)
+                old_button.deleteLater()
             
-            # 插入进度标签和空白组件
-            card_layout.insertWidget(button_index, self.cuda_progress_label)
-            card_layout.insertWidget(button_index + 1, spacer)
+                # 添加新按钮
+                card_layout.insertWidget(button_index, primary_button)
+                self.device_info_card.button = primary_button
+            
+            # 创建进度标签（用于下载/安装进度）
+            self.cuda_progress_label = QLabel("0%", self)
+            self.cuda_progress_label.setFixedSize(35, 35)
+            self.cuda_progress_label.setAlignment(Qt.AlignCenter)
+            
+            # 在按钮前添加进度标签
+            if button_index >= 0:
+                # 添加空白组件保持一致的间距
+                spacer = QWidget()
+                spacer.setFixedWidth(10)
+            
+                # 插入进度标签和空白组件
+                card_layout.insertWidget(button_index, self.cuda_progress_label)
+                card_layout.insertWidget(button_index + 1, spacer)
+        finally:
+            card_layout.invalidate()
+            self.device_info_card.setUpdatesEnabled(True)
         
         # 初始时隐藏进度标签
         self.cuda_progress_label.hide()
@@ -247,7 +345,7 @@ class SettingsView(ScrollArea):
         self.transcription_group.addSettingCard(self.language_card)
         
         # 输出格式设置
-        formats = [fmt.value.upper() for fmt in OutputFormat] # 通常格式值本身不需要翻译
+        formats = _FORMAT_CHOICES # 通常格式值本身不需要翻译
         self.format_card = ComboBoxSettingCard(
             cfg.default_format,
             FluentIcon.DOCUMENT,
@@ -259,7 +357,7 @@ class SettingsView(ScrollArea):
         self.transcription_group.addSettingCard(self.format_card)
         
         # 输出目录设置
-        output_dir_content = cfg.output_directory.value if cfg.output_directory.value else self._("默认（输出至与源文件相同目录）")
+        output_dir_content = self._cfg_snapshot["output_directory"] or self._("默认（输出至与源文件相同目录）")
         self.output_directory_card = PushSettingCard(
             self._("选择目录"),
             FluentIcon.FOLDER,
@@ -275,21 +373,25 @@ class SettingsView(ScrollArea):
         self.reset_output_dir_button.setToolTip(self._("重置为默认"))
         self.reset_output_dir_button.clicked.connect(self._on_reset_output_directory)
         
-        # 获取卡片布局
+        # 获取卡片布局，批量修改布局期间暂停重绘，结束后统一重新布局
         card_layout = self.output_directory_card.hBoxLayout
-        
-        # 获取按钮的位置
-        button_index = card_layout.indexOf(self.output_directory_card.button)
-        
-        # 在按钮前插入重置按钮
-        if button_index >= 0:
-            # 添加一个弹性空间，使按钮靠近
-            spacer = QWidget()
-            spacer.setFixedWidth(10)  # 设置按钮之间的间距
+        self.output_directory_card.setUpdatesEnabled(False)
+        try:
+            # 获取按钮的位置
+            button_index = card_layout.indexOf(self.output_directory_card.button)
             
-            # 在按钮前插入重置按钮和间距
-            card_layout.insertWidget(button_index, self.reset_output_dir_button)
-            card_layout.insertWidget(button_index + 1, spacer)
+            # 在按钮前插入重置按钮
+            if button_index >= 0:
+                # 添加一个弹性空间，使按钮靠近
+                spacer = QWidget()
+                spacer.setFixedWidth(10)  # 设置按钮之间的间距
+            
+                # 在按钮前插入重置按钮和间距
+                card_layout.insertWidget(button_index, self.reset_output_dir_button)
+                card_layout.insertWidget(button_index + 1, spacer)
+        finally:
+            card_layout.invalidate()
+            self.output_directory_card.setUpdatesEnabled(True)
         
         self.transcription_group.addSettingCard(self.output_directory_card)
         
@@ -318,6 +420,22 @@ class SettingsView(ScrollArea):
         )
         self.transcription_group.addSettingCard(self.punctuation_card)
 
+    def showEvent(self, event):
+        """视图显示事件，首次显示时创建高级设置卡片，并刷新隐藏期间待更新的精度选项"""
+        self._ensure_advanced_cards()
+        if self._precision_dirty:
+            self._precision_dirty = False
+            # 精度选项依赖环境检测，推迟到空闲时更新，不阻塞显示
+            QTimer.singleShot(0, self, self._update_compute_precision_options)
+        super().showEvent(event)
+
+    def _ensure_advanced_cards(self):
+        """确保高级设置卡片已创建"""
+        if self._advanced_cards_built:
+            return
+        self._advanced_cards_built = True
+        self._init_advanced_cards()
+
     def _init_advanced_cards(self):
         """初始化高级设置卡片"""
         # 波束搜索宽度设置
@@ -360,7 +478,7 @@ class SettingsView(ScrollArea):
             FluentIcon.SPEED_HIGH,
             self._("计算精度"),
             self._("选择计算精度"), # Default description, will be updated dynamically
-            [ct.value for ct in ComputeType], # Pass all possible options initially
+            _COMPUTE_TYPE_CHOICES, # Pass all possible options initially
             self.advanced_group
         )
         self.advanced_group.addSettingCard(self.compute_type_card)
@@ -401,7 +519,7 @@ class SettingsView(ScrollArea):
         self.advanced_group.addSettingCard(self.no_speech_card)
         
         # 根据VAD过滤的初始状态设置无语音阈值的启用状态
-        self.no_speech_card.setEnabled(cfg.vad_filter.value)
+        self.no_speech_card.setEnabled(self._cfg_snapshot["vad_filter"])
 
     def _init_widget(self):
         """初始化界面"""
@@ -427,19 +545,7 @@ class SettingsView(ScrollArea):
         self.title_label.move(36, 30)
         
         # 设置样式表
-        self.setStyleSheet("""
-            #settingView, #scrollWidget {
-                background-color: transparent;
-            }
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            #settingLabel {
-                font: 33px 'Microsoft YaHei';
-                background-color: transparent;
-            }
-        """)
+        self.setStyleSheet(_SETTINGS_QSS)
     
     def _init_layout(self):
         """初始化布局"""
@@ -489,15 +595,29 @@ class SettingsView(ScrollArea):
             "model_name": cfg.model_name, # 添加到字典中统一处理
         }
 
+        # 所有配置项共用一个槽函数，通过 sender() 反查配置键
+        self._cfg_item_to_key = {}
         for key, config_item in config_items_to_connect.items():
             if hasattr(config_item, 'valueChanged'):
-                # 使用 lambda 捕获当前的 key
-                config_item.valueChanged.connect(
-                    lambda value, k=key: self._handle_setting_changed(k, value)
-                )
+                self._cfg_item_to_key[id(config_item)] = key
+                # 记录当前值，用于忽略值未变化的重复通知
+                current_value = config_item.value
+                self._cfg_snapshot.setdefault(key, current_value.value if hasattr(current_value, 'value') else current_value)
+                config_item.valueChanged.connect(self._on_any_cfg_changed)
             else:
                 logger.warning(f"ConfigItem for key '{key}' 没有 valueChanged 信号或不存在。")
 
+    def _on_any_cfg_changed(self, value):
+        """配置项 valueChanged 信号的统一处理槽
+        
+        Args:
+            value: 配置项的新值
+        """
+        key = self._cfg_item_to_key.get(id(self.sender()))
+        if key is None:
+            return
+        self._handle_setting_changed(key, value)
+
     def _on_model_download_progress(self, event):
         """模型下载进度事件"""
         # 更新模型选择卡片的进度
@@ -515,14 +635,38 @@ class SettingsView(ScrollArea):
         )
         self.error_service.handle_error(error_info)
     
+    def _open_directory_dialog(self, title: str, directory: str, on_selected):
+        """以非阻塞方式打开目录选择对话框
+        
+        对话框通过 open() 以窗口模态显示，不会启动嵌套事件循环，
+        选择完成后通过 fileSelected 信号回调
+        
+        Args:
+            title: 对话框标题
+            directory: 初始目录
+            on_selected: 选择目录后的回调，参数为所选目录
+        """
+        dialog = QFileDialog(self, title, directory)
+        dialog.setFileMode(QFileDialog.Directory)
+        dialog.setOption(QFileDialog.ShowDirsOnly)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(on_selected)
+        dialog.open()
+    
     def _on_select_model_directory(self):
         """选择模型目录"""
-        folder = QFileDialog.getExistingDirectory(
-            self,
+        self._open_directory_dialog(
             self._("选择模型目录"),
-            cfg.model_path.value
+            cfg.model_path.value,
+            self._on_model_directory_selected
         )
+    
+    def _on_model_directory_selected(self, folder: str):
+        """模型目录选择完成
         
+        Args:
+            folder: 所选目录
+        """
         if folder:
             cfg.model_path.value = folder
             cfg.save()
@@ -542,15 +686,22 @@ class SettingsView(ScrollArea):
     
     def _on_select_output_directory(self):
         """选择输出目录"""
-        folder = QFileDialog.getExistingDirectory(
-            self,
+        self._open_directory_dialog(
             self._("选择输出目录"),
-            str(Path.home())
+            str(Path.home()),
+            self._on_output_directory_selected
         )
+    
+    def _on_output_directory_selected(self, folder: str):
+        """输出目录选择完成
         
+        Args:
+            folder: 所选目录
+        """
         if folder:
             self.output_directory_card.setContent(folder)
             self.config_service.set_output_directory(folder)
+            self._cfg_snapshot["output_directory"] = folder
             
             # 显示成功提示
             self._publish_success_notification(
@@ -562,6 +713,7 @@ class SettingsView(ScrollArea):
         """重置输出目录"""
         self.output_directory_card.setContent(self._("默认（与源文件相同目录）"))
         self.config_service.set_output_directory("")
+        self._cfg_snapshot["output_directory"] = ""
         
         # 显示成功提示
         self._publish_success_notification(
@@ -602,57 +754,81 @@ class SettingsView(ScrollArea):
         
     def _on_cuda_env_download_progress(self, event):
         """CUDA环境下载进度事件"""
-        self.cuda_progress_label.setText(f" {event.progress}%")
+        self._queue_cuda_progress(f" {event.progress}%")
+
+    def _queue_cuda_progress(self, text: str):
+        """记录最新的CUDA进度文本，定时器到期时再写入标签
+        
+        Args:
+            text: 进度文本
+        """
+        self._cuda_progress_pending = text
+        if not self._cuda_progress_timer.isActive():
+            self._cuda_progress_timer.start()
+
+    def _flush_cuda_progress(self):
+        """将最新的CUDA进度文本写入标签"""
+        if self._cuda_progress_pending is None:
+            return
+        self.cuda_progress_label.setText(self._cuda_progress_pending)
+        self._cuda_progress_pending = None
 
     def _on_cuda_env_download_started(self, event):
         """CUDA环境开始下载回调"""
         logger.info("CUDA环境下载开始")
-        self._update_cuda_status_ui()
+        self._cuda_downloading = True
+        self._schedule_cuda_ui_update()
 
     def _on_cuda_env_download_completed(self, event):
         """CUDA环境下载完成回调"""
         logger.info(f"CUDA环境下载完成: success={event.success}, error={event.error}")
+        self._cuda_downloading = False
         if not event.success:
              self._publish_error_notification(self._(NotificationTitle.CUDA_ENV_ERROR.value), self._("CUDA环境下载失败: {error}").format(error=event.error))
         # 无论结果如何都更新UI（下载失败时会显示按钮或转换到安装状态）
-        self._update_cuda_status_ui()
+        self._schedule_cuda_ui_update()
 
     def _on_cuda_env_download_error(self, event):
         """CUDA环境下载错误回调"""
         logger.error(f"CUDA环境下载错误: {event.error}")
+        self._cuda_downloading = False
         self._publish_error_notification(
             self._(NotificationTitle.CUDA_ENV_ERROR.value),
             self._("CUDA环境下载错误: {error}").format(error=event.error)
         )
-        self._update_cuda_status_ui() # 恢复UI状态
+        self._schedule_cuda_ui_update() # 恢复UI状态
 
     def _on_cuda_env_install_started(self, event):
         """CUDA环境安装开始事件"""
         logger.info("CUDA环境安装开始")
-        self._update_cuda_status_ui()
+        self._cuda_installing = True
+        self._schedule_cuda_ui_update()
 
     def _on_cuda_env_install_progress(self, event):
         """CUDA环境安装进度事件"""
         # 更新CUDA进度标签
-        self.cuda_progress_label.setText(f"{event.progress}%")
+        self._queue_cuda_progress(f"{event.progress}%")
 
     def _on_cuda_env_install_completed(self, event):
         """CUDA环境安装完成事件"""
         logger.info(f"CUDA环境安装完成: success={event.success}, error={event.error}") # 日志不翻译
+        self._cuda_installing = False
         if not event.success:
              self._publish_error_notification(self._(NotificationTitle.CUDA_ENV_ERROR.value), self._("CUDA环境安装失败: {error}").format(error=event.error))
-        # 刷新环境信息并更新UI
+        # 无论结果如何都更新UI：安装失败或环境未变化时，环境状态事件会因快照相同而被跳过
+        self._schedule_cuda_ui_update()
+        # 刷新环境信息，环境变化时由环境状态事件再更新UI
         self.environment_service.refresh() # 刷新在内部处理
 
     def _on_toggle_gpu_preference_clicked(self):
         """切换GPU偏好设置或触发CUDA环境下载按钮点击事件"""
         logger.info("用户点击GPU设置按钮")
         
-        env_info = self.environment_service.get_environment_info()
-        current_device_pref = self.config_service.get_device()
+        snapshot = self._build_env_snapshot()
+        current_device_pref = snapshot.device_pref
 
         # 检查是否需要触发下载 (GPU硬件可用但环境未就绪)
-        if env_info.is_windows and env_info.has_gpu and not env_info.can_use_gpu_acceleration():
+        if snapshot.gpu_hardware_available and not snapshot.can_accel:
             logger.info("GPU可用但环境未就绪，触发CUDA环境下载")
             # 添加即时UI反馈
             self.device_info_card.button.setText(self._("正在准备..."))
@@ -687,154 +863,170 @@ class SettingsView(ScrollArea):
     def _on_environment_status_changed(self, event: EnvironmentStatusEvent):
         """处理环境状态变更事件"""
         logger.info("接收到环境状态变更事件，更新UI")
+        # 环境快照只获取一次，与上次相同时无需刷新
+        snapshot = self._build_env_snapshot()
+        if snapshot == self._last_env_snapshot:
+            return
+        self._last_env_snapshot = snapshot
+        
         # 根据新的环境信息刷新CUDA状态UI
-        self._update_cuda_status_ui()
+        self._schedule_cuda_ui_update()
+        # 精度选项只在视图可见时立即刷新，否则等到下次显示
+        if self.isVisible():
+            self._update_compute_precision_options(snapshot)
+        else:
+            self._precision_dirty = True
 
-    def __del__(self):
-        """组件销毁时取消事件订阅"""
-        try:
-            # 取消订阅所有事件
-            event_bus.unsubscribe(EventTypes.MODEL_DOWNLOAD_STARTED, self._on_model_downloading)
-            event_bus.unsubscribe(EventTypes.MODEL_DOWNLOAD_PROGRESS, self._on_model_download_progress)
-            event_bus.unsubscribe(EventTypes.MODEL_DOWNLOAD_COMPLETED, self._on_download_completed)
-            event_bus.unsubscribe(EventTypes.MODEL_DOWNLOAD_ERROR, self._on_model_download_error)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_DOWNLOAD_STARTED, self._on_cuda_env_download_started)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_DOWNLOAD_PROGRESS, self._on_cuda_env_download_progress)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_DOWNLOAD_COMPLETED, self._on_cuda_env_download_completed)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_DOWNLOAD_ERROR, self._on_cuda_env_download_error)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_INSTALL_STARTED, self._on_cuda_env_install_started)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_INSTALL_PROGRESS, self._on_cuda_env_install_progress)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_INSTALL_COMPLETED, self._on_cuda_env_install_completed)
-            event_bus.unsubscribe(EventTypes.ENVIRONMENT_STATUS_CHANGED, self._on_environment_status_changed)
-        except:
-            # 忽略可能的异常
-            pass
-
-    def _publish_success_notification(self, title, content):
-        """发布成功通知事件"""
-        event_data = NotificationSuccessEvent(
-            title=title,
-            content=content
-        )
-        event_bus.publish(EventTypes.NOTIFICATION_SUCCESS, event_data)
+    def _publish_success_notification(self, title, content, _publish=event_bus.publish,
+                                      _event_type=EventTypes.NOTIFICATION_SUCCESS, _make=NotificationSuccessEvent):
+        """发布成功通知事件
+        
+        发布函数、事件类型和事件类在定义时绑定为默认参数，调用时按局部变量访问
+        """
+        _publish(_event_type, _make(title, content))
     
-    def _publish_error_notification(self, title, content):
-        """发布错误通知事件"""
-        event_data = NotificationErrorEvent(
-            title=title,
-            content=content
-        )
-        event_bus.publish(EventTypes.NOTIFICATION_ERROR, event_data)
+    def _publish_error_notification(self, title, content, _publish=event_bus.publish,
+                                    _event_type=EventTypes.NOTIFICATION_ERROR, _make=NotificationErrorEvent):
+        """发布错误通知事件
+        
+        发布函数、事件类型和事件类在定义时绑定为默认参数，调用时按局部变量访问
+        """
+        _publish(_event_type, _make(title, content))
+
+    def _apply_button_state(self, button, text: str, tooltip: Optional[str], enabled: bool):
+        """一次性更新按钮的文本、提示和启用状态
+        
+        更新期间阻止按钮信号并暂停重绘，结束后只重绘一次
+        
+        Args:
+            button: 要更新的按钮
+            text: 按钮文本
+            tooltip: 提示文本，为 None 时保持不变
+            enabled: 是否启用
+        """
+        blocker = QSignalBlocker(button)
+        button.setUpdatesEnabled(False)
+        try:
+            button.setText(text)
+            if tooltip is not None:
+                button.setToolTip(tooltip)
+            button.setEnabled(enabled)
+        finally:
+            button.setUpdatesEnabled(True)
+            blocker.unblock()
 
     def _set_ui_for_gpu_unavailable(self, button):
         """Sets UI elements when GPU hardware is unavailable."""
-        button.setText(self._("CUDA加速不可用"))
-        button.setToolTip(self._("仅支持Windows + NVIDIA GPU"))
-        button.setEnabled(False)
+        self._apply_button_state(button, self._("CUDA加速不可用"), self._("仅支持Windows + NVIDIA GPU"), False)
         return self._("CPU (未检测到兼容GPU)")
 
-    def _set_ui_for_busy(self, button, is_downloading):
+    def _set_ui_for_busy(self, button, snapshot: _EnvSnapshot):
         """Sets UI elements when CUDA environment is downloading or installing."""
-        if is_downloading:
-            button.setText(self._("正在下载..."))
-            button.setToolTip(self._("CUDA环境下载中"))
+        if snapshot.is_downloading:
+            self._apply_button_state(button, self._("正在下载..."), self._("CUDA环境下载中"), False)
             device_display_name = self._("CPU (CUDA环境下载中)")
         else: # is_installing
-            button.setText(self._("正在安装..."))
-            button.setToolTip(self._("CUDA环境安装中"))
+            self._apply_button_state(button, self._("正在安装..."), self._("CUDA环境安装中"), False)
             device_display_name = self._("CPU (CUDA环境安装中)")
-        button.setEnabled(False)
         return device_display_name
 
-    def _set_ui_for_device_switch(self, button, current_device_pref, env_info):
+    def _set_ui_for_device_switch(self, button, snapshot: _EnvSnapshot):
         """用于可切换设备时的UI显示"""
-        if current_device_pref == Device.CUDA.value:
-            button.setText(self._("禁用GPU加速"))
-            button.setToolTip(self._("切换回CPU进行转录"))
-            device_display_name = self._("NVIDIA GPU ({gpu_name})").format(gpu_name=env_info.gpu_name)
+        if snapshot.device_pref == Device.CUDA.value:
+            self._apply_button_state(button, self._("禁用GPU加速"), self._("切换回CPU进行转录"), True)
+            device_display_name = self._("NVIDIA GPU ({gpu_name})").format(gpu_name=snapshot.gpu_name)
         else: # 偏好是 CPU 或 auto
-            button.setText(self._("启用GPU加速"))
-            button.setToolTip(self._("切换到GPU进行转录"))
+            self._apply_button_state(button, self._("启用GPU加速"), self._("切换到GPU进行转录"), True)
             device_display_name = self._("CPU")
-        button.setEnabled(True)
         return device_display_name
     
-    def _set_ui_for_gpu_ready(self, button, current_device_pref, env_info):
-        device_display_name = self._("NVIDIA GPU ({gpu_name})").format(gpu_name=env_info.gpu_name)
-        button.setText(self._("GPU加速已启用"))
-        button.setEnabled(False)
+    def _set_ui_for_gpu_ready(self, button, snapshot: _EnvSnapshot):
+        device_display_name = self._("NVIDIA GPU ({gpu_name})").format(gpu_name=snapshot.gpu_name)
+        self._apply_button_state(button, self._("GPU加速已启用"), None, False)
         return device_display_name
 
     def _set_ui_for_env_not_ready(self, button):
         """Sets UI elements when GPU hardware is available but CUDA env is not ready."""
-        button.setText(self._("启用CUDA加速"))
-        button.setToolTip(self._("下载并安装必要的CUDA环境"))
-        button.setEnabled(True) # Allow user to click to trigger download
+        # Allow user to click to trigger download
+        self._apply_button_state(button, self._("启用CUDA加速"), self._("下载并安装必要的CUDA环境"), True)
         return self._("CPU (CUDA环境未就绪)")
 
+    def _schedule_cuda_ui_update(self):
+        """安排刷新CUDA状态UI，定时器到期前的多次请求只刷新一次"""
+        if not self._cuda_ui_timer.isActive():
+            self._cuda_ui_timer.start()
+
+    def _build_env_snapshot(self) -> _EnvSnapshot:
+        """获取一次环境信息、设备偏好和下载/安装状态，构建快照
+        
+        Returns:
+            _EnvSnapshot: 环境快照
+        """
+        env_info = self.environment_service.get_environment_info()
+        
+        return _EnvSnapshot(
+            is_windows=env_info.is_windows,
+            has_gpu=env_info.has_gpu,
+            gpu_name=env_info.gpu_name,
+            can_accel=env_info.can_use_gpu_acceleration(),
+            is_downloading=self._cuda_downloading,
+            is_installing=self._cuda_installing,
+            device_pref=self.config_service.get_device(),
+        )
+
     def _update_cuda_status_ui(self):
         """根据环境、配置和下载/安装状态更新CUDA按钮和进度标签 (Refactored)"""
-        env_info = self.environment_service.get_environment_info()
-        model_service = self.model_service
-        current_device_pref = self.config_service.get_device()
+        snapshot = self._build_env_snapshot()
         button = self.device_info_card.button
 
-        is_downloading = "cuda_env" in model_service.active_downloaders and model_service.active_downloaders["cuda_env"].isRunning()
-        is_installing = "cuda_env_installer" in model_service.active_downloaders and model_service.active_downloaders["cuda_env_installer"].isRunning()
-        is_busy = is_downloading or is_installing
-
-        gpu_hardware_available = env_info.is_windows and env_info.has_gpu
+        is_busy = snapshot.is_downloading or snapshot.is_installing
 
         device_display_name = "CPU" # Default
 
-        if not gpu_hardware_available:
+        if not snapshot.gpu_hardware_available:
             device_display_name = self._set_ui_for_gpu_unavailable(button)
         elif is_busy:
-            device_display_name = self._set_ui_for_busy(button, is_downloading)
+            device_display_name = self._set_ui_for_busy(button, snapshot)
         else: # GPU hardware available and not busy
-            cuda_env_ready = env_info.can_use_gpu_acceleration()
-            if cuda_env_ready:
-                # device_display_name = self._set_ui_for_device_switch(button, current_device_pref, env_info) # 需要切换设备时启用这一行，并注释掉下一行
-                device_display_name = self._set_ui_for_gpu_ready(button, current_device_pref, env_info)
+            if snapshot.can_accel:
+                # device_display_name = self._set_ui_for_device_switch(button, snapshot) # 需要切换设备时启用这一行，并注释掉下一行
+                device_display_name = self._set_ui_for_gpu_ready(button, snapshot)
             else: # Env not ready
                 device_display_name = self._set_ui_for_env_not_ready(button)
-        # Update device name content
-        try:
+        # Update device name content (unchanged text would still trigger a relayout)
+        if device_display_name != self._last_device_display:
+            self._last_device_display = device_display_name
             self.device_info_card.setContent(self._("当前设备: {device_name}").format(device_name=device_display_name))
-        except AttributeError:
-            logger.warning("PushSettingCard可能没有setContent方法，无法更新设备显示名称。") # 日志不翻译
-            pass
 
         # Update progress label visibility
-        if is_busy:
-            self.cuda_progress_label.show()
-        else:
-            self.cuda_progress_label.hide()
+        if is_busy != self._last_is_busy:
+            self._last_is_busy = is_busy
+            self.cuda_progress_label.setVisible(is_busy)
 
-    def _update_compute_precision_options(self):
-        """根据当前生效的设备模式动态更新计算精度选项"""
-        if not hasattr(self, 'compute_type_card'): # Ensure card exists
-             logger.warning("compute_type_card尚未初始化，无法更新精度选项。")
+    def _update_compute_precision_options(self, snapshot: Optional[_EnvSnapshot] = None):
+        """根据当前生效的设备模式动态更新计算精度选项
+        
+        Args:
+            snapshot: 调用方已获取的环境快照，为 None 时重新获取
+        """
+        if not self._advanced_cards_built: # 卡片创建时会再次调用
              return
              
-        env_info = self.environment_service.get_environment_info()
+        if snapshot is None:
+            snapshot = self._build_env_snapshot()
         # 获取用户当前的设备偏好和实际GPU加速能力
-        current_device_pref = self.config_service.get_device()
-        gpu_acceleration_actually_available = env_info.can_use_gpu_acceleration()
+        current_device_pref = snapshot.device_pref
+        gpu_acceleration_actually_available = snapshot.can_accel
 
         # 确定最终生效的模式：必须实际可用 且 用户意图是使用 CUDA
         should_use_gpu_mode = gpu_acceleration_actually_available and not current_device_pref == Device.CPU.value
 
-        precisions = []
-        precision_description = ""
-
         if should_use_gpu_mode:
-            precisions = [precision.value for precision in ComputeType]
+            precisions = _COMPUTE_TYPE_CHOICES
             precision_description = self._("选择计算精度（GPU加速已启用）")
             logger.debug("更新计算精度选项为 GPU 模式") # 日志不翻译
         else:
-            # CPU 模式下支持 float32 和 int8
-            precisions = [ComputeType.FLOAT32.value, ComputeType.INT8.value]
+            precisions = _CPU_COMPUTE_TYPE_CHOICES
             precision_description = self._("选择计算精度（CPU模式，推荐int8）")
             logger.debug("更新计算精度选项为 CPU 模式") # 日志不翻译
 
@@ -854,70 +1046,59 @@ class SettingsView(ScrollArea):
             new_compute_type = reset_target # 更新待选中的值
             # 注意：这里直接修改了配置，如果希望只临时调整UI，逻辑会更复杂
 
-        # 更新下拉框
-        self.compute_type_card.comboBox.blockSignals(True) # 阻止信号触发配置更改
-        self.compute_type_card.comboBox.clear()
-        # --- 修改开始 ---
-        # 创建文本到枚举成员的映射 (需要确保 ComputeType 已在文件顶部导入)
-        text_to_enum = {member.value: member for member in ComputeType}
-
-        for precision_text in precisions:
-            enum_member = text_to_enum.get(precision_text)
-            if enum_member:
-                # 使用 addItem 并显式设置 userData
-                self.compute_type_card.comboBox.addItem(precision_text, userData=enum_member)
-            else:
-                logger.warning(f"无法为精度文本 '{precision_text}' 找到对应的枚举成员")
-        # --- 修改结束 ---
-
-        self.compute_type_card.comboBox.setCurrentText(new_compute_type)
-        self.compute_type_card.comboBox.blockSignals(False) # 恢复信号
+        # 选项、选中值和描述均未变化时无需重建下拉框，避免多余的模型重置信号
+        precision_state = (should_use_gpu_mode, precisions, new_compute_type, precision_description)
+        if precision_state == self._last_precision_state:
+            return
+        self._last_precision_state = precision_state
 
-        # 更新描述文本 (假设 contentLabel 是描述标签)
+        # 增量更新下拉框，期间阻止信号触发配置更改（异常时也保证恢复信号）
+        combo_box = self.compute_type_card.comboBox
+        blocker = QSignalBlocker(combo_box)
         try:
-            self.compute_type_card.contentLabel.setText(precision_description)
-        except AttributeError:
-             logger.warning("无法更新 compute_type_card 的描述文本。")
+            current_items = [combo_box.itemText(i) for i in range(combo_box.count())]
+            if current_items != list(precisions):
+                # 移除新列表中没有的选项（倒序移除，保证索引有效）
+                for index in reversed(range(len(current_items))):
+                    if current_items[index] not in precisions:
+                        combo_box.removeItem(index)
 
-    def _on_environment_status_changed(self, event: EnvironmentStatusEvent):
-        """处理环境状态变更事件"""
-        logger.info("接收到环境状态变更事件，更新UI")
-        # 根据新的环境信息刷新CUDA状态UI
-        self._update_cuda_status_ui()
+                # 两个列表均按 ComputeType 顺序排列，在对应位置插入缺少的选项
+                for index, precision_text in enumerate(precisions):
+                    if index < combo_box.count() and combo_box.itemText(index) == precision_text:
+                        continue
+                    enum_member = _COMPUTE_TYPE_BY_VALUE.get(precision_text)
+                    if enum_member:
+                        # 显式设置 userData 为枚举成员
+                        combo_box.insertItem(index, precision_text, userData=enum_member)
+                    else:
+                        logger.warning(f"无法为精度文本 '{precision_text}' 找到对应的枚举成员")
+
+            if combo_box.currentText() != new_compute_type:
+                combo_box.setCurrentText(new_compute_type)
+        finally:
+            blocker.unblock()
+
+        # 更新描述文本
+        self.compute_type_card.setContent(precision_description)
 
     def _handle_setting_changed(self, config_key: str, new_value: any):
         """处理 ConfigItem.valueChanged 信号或手动触发，发布配置变更事件"""
-        # 从枚举或ConfigItem获取实际值用于发布
-        value_to_publish = new_value.value if hasattr(new_value, 'value') else new_value
-        logger.debug(f"Setting changed: key={config_key}, new_value={value_to_publish}")
+        # 从枚举获取实际值用于发布
+        value_to_publish = new_value.value if isinstance(new_value, Enum) else new_value
+
+        # 值未变化（如重置或重复发出的信号）时不再发布事件
+        if config_key in self._cfg_snapshot and self._cfg_snapshot[config_key] == value_to_publish:
+            return
+        self._cfg_snapshot[config_key] = value_to_publish
+        # 按参数传入，调试级别关闭时 loguru 不会格式化消息
+        logger.debug("Setting changed: key={}, new_value={}", config_key, value_to_publish)
 
         if config_key == "model_name":
             self._update_language_card_state(value_to_publish)
 
-        # 调用 ConfigService 的发布方法
-        if hasattr(self, 'config_service') and hasattr(self.config_service, '_publish_config_change_event'):
-            self.config_service._publish_config_change_event(config_key, value_to_publish)
-        else:
-            logger.error("ConfigService 或其 _publish_config_change_event 方法在 SettingsView 中不可用。")
-
-    def __del__(self):
-        try:
-            # 取消订阅所有事件
-            event_bus.unsubscribe(EventTypes.MODEL_DOWNLOAD_STARTED, self._on_model_downloading)
-            event_bus.unsubscribe(EventTypes.MODEL_DOWNLOAD_PROGRESS, self._on_model_download_progress)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_DOWNLOAD_PROGRESS, self._on_cuda_env_download_progress)
-            event_bus.unsubscribe(EventTypes.MODEL_DOWNLOAD_COMPLETED, self._on_download_completed)
-            event_bus.unsubscribe(EventTypes.MODEL_DOWNLOAD_ERROR, self._on_model_download_error)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_DOWNLOAD_STARTED, self._on_cuda_env_download_started)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_DOWNLOAD_COMPLETED, self._on_cuda_env_download_completed)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_DOWNLOAD_ERROR, self._on_cuda_env_download_error)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_INSTALL_STARTED, self._on_cuda_env_install_started)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_INSTALL_PROGRESS, self._on_cuda_env_install_progress)
-            event_bus.unsubscribe(EventTypes.CUDA_ENV_INSTALL_COMPLETED, self._on_cuda_env_install_completed)
-            event_bus.unsubscribe(EventTypes.ENVIRONMENT_STATUS_CHANGED, self._on_environment_status_changed)
-        except:
-            # 忽略可能的异常
-            pass
+        # 调用 ConfigService 的发布方法（config_service 由构造函数注入，始终可用）
+        self.config_service._publish_config_change_event(config_key, value_to_publish)
 
     def _update_language_card_state(self, model_name_value: str):
         """根据当前选择的模型更新语言卡片的状态和描述"""
@@ -18,10 +18,12 @@
 """
 
 import os
-from typing import List
+import weakref
+from functools import partial
+from typing import Dict, List
 from loguru import logger
 
-from PySide6.QtCore import Qt, Signal, QEvent, Slot, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QThread, QCoreApplication
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QFrame, QHeaderView, QTableWidgetItem, QFileDialog, QAbstractItemView
@@ -35,9 +37,9 @@ from qfluentwidgets import (
 )
 
 from core.models.model_data import ModelData
-from core.utils.file_utils import FileSystemUtils, get_supported_media_extensions, get_file_extension
+from core.utils.file_utils import FileSystemUtils, is_supported_media_file
 from core.models.notification_model import NotificationTitle, NotificationContent
-from core.models.task_model import ProcessStatus
+from core.models.task_model import ProcessStatus, STATUS_DISPLAY_KEYS
 from core.models.config import cfg
 from core.services.config_service import ConfigService
 from core.services.transcription_service import TranscriptionService
@@ -51,22 +53,46 @@ from ui.components.transcript_viewer import TranscriptViewer
 from core.events import (
     event_bus, EventTypes,
     RequestAddTasksEvent, RequestRemoveTaskEvent, RequestClearTasksEvent,
-    RequestStartProcessingEvent, RequestCancelProcessingEvent, TaskAddedEvent,
+    RequestStartProcessingEvent, RequestCancelProcessingEvent, TaskAddedEvent, TasksAddedEvent,
     TaskRemovedEvent, TaskTimerUpdatedEvent, TaskStateChangedEvent,
     TranscriptionStartedEvent, TranscriptionCompletedEvent # 添加全局事件
 )
 from core.models.transcription_model import TranscriptionParameters
 
+# 转录日志保留的最大行数
+_LOG_MAX_BLOCKS = 2000
+# 进度条重绘残留文本的起始字符（回车、ANSI控制序列）
+_PROGRESS_ARTIFACT_PREFIXES = ('\r', '\x1b')
+# 错误消息模板的翻译键，模块加载时取一次
+_FILE_ADD_FAILED_FMT = NotificationContent.FILE_ADD_FAILED.value
+_DIRECTORY_OPEN_FAILED_FMT = NotificationContent.DIRECTORY_OPEN_FAILED.value
+
+
 class TaskView(QWidget):
     """任务视图"""
     # 定义用于线程安全更新TaskTableManager的信号
     requestAddTask = Signal(str, str, str, str) # task_id, file_path, status_text, duration
+    requestAddTasks = Signal(list)              # [(task_id, file_path, status_text, duration), ...]
     requestRemoveTask = Signal(str)             # task_id
     requestUpdateStatus = Signal(str, str)      # task_id, status_text
     requestUpdateProgress = Signal(str, float)  # task_id, progress
     requestUpdateDuration = Signal(str, str)    # task_id, duration_text
     requestUpdateActionButtons = Signal(str, bool)# task_id, is_active
     
+    # 事件订阅表：(事件类型, 处理方法名)，订阅与取消订阅都由此表驱动
+    # TASK_TIMER_UPDATED 不再订阅，改用UI计时器主动更新
+    _SUBSCRIPTIONS = (
+        (EventTypes.TASK_STATE_CHANGED, "_handle_task_state_changed"),
+        (EventTypes.TASK_ADDED, "_handle_task_added_event"),
+        (EventTypes.TASKS_ADDED, "_handle_tasks_added_event"),
+        (EventTypes.MODEL_LOADED, "_handle_model_loaded"),
+        # 统一的转录进度与文本事件
+        (EventTypes.TRANSCRIPTION_PROCESS_INFO, "_handle_transcription_process_info"),
+        (EventTypes.TASK_REMOVED, "_handle_task_removed_event"),
+        # 全局完成事件
+        (EventTypes.TRANSCRIPTION_COMPLETED, "_handle_global_transcription_completed"),
+    )
+    
     @inject
     def __init__(
         self,
@@ -105,10 +131,25 @@ class TaskView(QWidget):
         # 初始化转录查看器
         self.transcript_viewer = TranscriptViewer(self.log_browser)
 
+        # 预先翻译所有状态的显示文本，事件处理时直接查表
+        self._status_text = {
+            status: self._(f"status_{key}") for status, key in STATUS_DISPLAY_KEYS.items()
+        }
+
         # 添加UI计时器用于平滑更新时长
         self.ui_timer = QTimer(self)
         self.ui_timer.setInterval(1000) # 每秒触发
         self.ui_timer.timeout.connect(self._update_duration_display)
+        # 上次发射的 (任务ID, 时长文本)，未变化时不再更新表格
+        self._last_duration = None
+
+        # 合并高频的转录进度事件：暂存每个任务的最新进度和新增文本，最多每50毫秒刷新一次界面
+        self._pending_progress: Dict[str, float] = {}
+        self._pending_text: List[str] = []
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(50)
+        self._coalesce_timer.timeout.connect(self._flush_pending)
 
         # 初始化按钮状态
         self._update_button_states()
@@ -120,22 +161,17 @@ class TaskView(QWidget):
         self._setup_connections()
         self._connect_table_manager_signals() # 新增：连接内部信号到TableManager的槽
 
-    def __del__(self):
-        """组件销毁时清理资源"""
-        try:
-            # 取消事件订阅
-            event_bus.unsubscribe(EventTypes.TASK_STATE_CHANGED, self._handle_task_state_changed)
-            event_bus.unsubscribe(EventTypes.TASK_ADDED, self._handle_task_added_event)
-            event_bus.unsubscribe(EventTypes.MODEL_LOADED, self._handle_model_loaded)
-            event_bus.unsubscribe(EventTypes.TRANSCRIPTION_PROCESS_INFO, self._handle_transcription_process_info)
-            event_bus.unsubscribe(EventTypes.TASK_REMOVED, self._handle_task_removed_event)
-            # 添加全局完成事件取消订阅
-            event_bus.unsubscribe(EventTypes.TRANSCRIPTION_COMPLETED, self._handle_global_transcription_completed)
-            # 移除对 TASK_TIMER_UPDATED 的取消订阅
-            # event_bus.unsubscribe(EventTypes.TASK_TIMER_UPDATED, self._handle_task_timer_updated_event)
-        except:
-            # 忽略可能的异常
-            pass
+    @staticmethod
+    def _cleanup_subscriptions(owner_ref, *_):
+        """取消事件订阅，由 destroyed 或 aboutToQuit 信号触发
+        
+        Args:
+            owner_ref: 订阅者的弱引用
+        """
+        # 订阅者已被回收时，事件总线的 finalize 回调已释放其订阅
+        owner = owner_ref()
+        if owner is not None:
+            event_bus.unsubscribe_all(owner)
         
     def _init_ui(self):
         """初始化UI"""
@@ -186,6 +222,8 @@ class TaskView(QWidget):
         
         self.log_browser = TextBrowser(self)
         self.log_browser.setMinimumHeight(150)  # 设置最小高度
+        # 限制日志最大行数，长时间转录时内存和重新布局的开销保持有界
+        self.log_browser.document().setMaximumBlockCount(_LOG_MAX_BLOCKS)
         
         log_layout.addLayout(log_title_layout)
         log_layout.addWidget(self.log_browser)
@@ -206,49 +244,69 @@ class TaskView(QWidget):
         # 连接表格管理器的按钮点击事件
         self.table_manager.connect_button_clicked("delete", self._on_delete_clicked)
         
-        # 订阅事件总线事件
-        event_bus.subscribe(EventTypes.TASK_STATE_CHANGED, self._handle_task_state_changed)
-        event_bus.subscribe(EventTypes.TASK_ADDED, self._handle_task_added_event)
-        # 添加MODEL_LOADED事件订阅
-        event_bus.subscribe(EventTypes.MODEL_LOADED, self._handle_model_loaded)
-        # 订阅统一的转录进度与文本事件
-        event_bus.subscribe(EventTypes.TRANSCRIPTION_PROCESS_INFO, self._handle_transcription_process_info)
-        event_bus.subscribe(EventTypes.TASK_REMOVED, self._handle_task_removed_event)
-        # 添加全局完成事件订阅
-        event_bus.subscribe(EventTypes.TRANSCRIPTION_COMPLETED, self._handle_global_transcription_completed)
-        # 移除对 TASK_TIMER_UPDATED 的订阅，改用UI计时器主动更新
-        # event_bus.subscribe(EventTypes.TASK_TIMER_UPDATED, self._handle_task_timer_updated_event)
+        # 订阅事件总线事件，以本视图作为订阅者登记，销毁时一次性取消
+        event_bus.subscribe_many(
+            ((event_type, getattr(self, handler_name)) for event_type, handler_name in self._SUBSCRIPTIONS),
+            owner=self
+        )
+        
+        # 视图销毁时取消订阅；槽函数只持有视图的弱引用，
+        # 连接到 aboutToQuit 不会让应用对象一直持有视图，事件总线的自动释放仍可生效
+        cleanup = partial(TaskView._cleanup_subscriptions, weakref.ref(self))
+        self.destroyed.connect(cleanup)
+        # 应用退出时视图可能来不及销毁，在事件循环结束前提前取消订阅
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(cleanup)
     
     def _handle_task_state_changed(self, event: TaskStateChangedEvent):
         """处理任务状态变更事件 (事件总线回调)"""
-        if hasattr(event, 'task_id') and hasattr(event, 'status'):
-            # 获取状态键
-            status_key = ProcessStatus.get_display_text(event.status)
-            # 翻译状态键
-            translated_status = self._(f"status_{status_key}")
-            # 发射信号，让槽函数在主线程更新UI
-            self.requestUpdateStatus.emit(event.task_id, translated_status)
-            # 更新: 获取Task对象并调用is_active()方法
-            task = self.task_service.get_task(event.task_id) # 依赖下一步添加 get_task 方法
-            if task:
-                is_active = task.is_active()
-                self.requestUpdateActionButtons.emit(event.task_id, is_active)
-            else:
-                 logger.warning(f"无法在处理状态变更时找到任务: {event.task_id}")
-
-            # 如果任务完成，处理完成逻辑 (这部分不直接更新UI，可以保留)
-            if event.status == ProcessStatus.COMPLETED and event.output_path:
-                self._on_task_completed(event.task_id, event.output_path)
+        # 进度与状态共用同一单元格，丢弃尚未刷新的进度，避免覆盖新状态
+        self._pending_progress.pop(event.task_id, None)
+        # 先写入暂存的转录文本，保证其显示在状态变更产生的日志之前
+        self._flush_pending()
+        # 查表获取翻译后的状态文本
+        translated_status = self._status_text[event.status]
+        # 在主线程更新UI
+        self._update_table(self.requestUpdateStatus, self.table_manager.update_task_status,
+                           event.task_id, translated_status)
+        # 更新: 获取Task对象并调用is_active()方法
+        task = self.task_service.get_task(event.task_id) # 依赖下一步添加 get_task 方法
+        if task:
+            is_active = task.is_active()
+            self._update_table(self.requestUpdateActionButtons, self.table_manager.update_task_action_buttons,
+                               event.task_id, is_active)
         else:
-             logger.warning(f"接收到无效的TASK_STATE_CHANGED事件: {event}")
+             logger.warning(f"无法在处理状态变更时找到任务: {event.task_id}")
+
+        # 如果任务完成，处理完成逻辑 (这部分不直接更新UI，可以保留)
+        if event.status == ProcessStatus.COMPLETED and event.output_path:
+            self._on_task_completed(event.task_id, event.output_path)
     
     def _handle_transcription_process_info(self, event):
-        """处理统一的转录进度与文本事件"""
-        # 添加文本
-        self.transcript_viewer.add_transcript_text(event.process_text)
-        # 发射信号更新进度
-        if hasattr(event, 'task_id') and hasattr(event, 'progress'):
-             self.requestUpdateProgress.emit(event.task_id, event.progress)
+        """处理统一的转录进度与文本事件，暂存后由合并计时器统一刷新"""
+        # 暂存文本，跳过空白文本以及进度条重绘残留（回车/控制序列开头或含进度条），避免无谓的文档布局
+        text = event.process_text
+        if text and text.strip() and not text.startswith(_PROGRESS_ARTIFACT_PREFIXES) and '%|' not in text:
+            self._pending_text.append(text)
+        # 进度总是暂存，同一任务只保留最新值
+        self._pending_progress[event.task_id] = event.progress
+        # 计时器未运行时才启动，保证首个事件后最多50毫秒刷新
+        if not self._coalesce_timer.isActive():
+            self._coalesce_timer.start()
+
+    def _flush_pending(self):
+        """刷新暂存的转录进度和文本"""
+        # 提前刷新时计时器可能仍在运行，停止以免空刷新
+        self._coalesce_timer.stop()
+        if self._pending_text:
+            texts, self._pending_text = self._pending_text, []
+            self.transcript_viewer.add_transcript_texts(texts)
+        if self._pending_progress:
+            progress, self._pending_progress = self._pending_progress, {}
+            for task_id, value in progress.items():
+                self._update_table(self.requestUpdateProgress, self.table_manager.update_task_progress,
+                                   task_id, value)
 
     
     def _on_add_clicked(self):
@@ -261,9 +319,8 @@ class TaskView(QWidget):
             
             # 使用ErrorHandlingService处理错误
             error_info = ErrorInfo(
-                message=NotificationContent.FILE_ADD_FAILED.value.format(error_message=str(e)),
-                exception=e,
-                category=ErrorCategory.FILE_OPERATION,
+                message=self._(_FILE_ADD_FAILED_FMT).format(error_message=str(e)), # 翻译
+                category=ErrorCategory.FILE_IO,
                 priority=ErrorPriority.MEDIUM,
                 source="TaskView._on_add_clicked",
                 user_visible=True
@@ -275,12 +332,11 @@ class TaskView(QWidget):
         # 从配置服务获取上次打开的目录
         last_directory = self.config_service.get_last_directory()
         
-        # 使用FileSystemUtils的通用方法创建文件对话框
+        # 使用FileSystemUtils的通用方法创建文件对话框（默认使用所有支持的媒体格式）
         files, _ = FileSystemUtils.create_file_dialog(
             parent=self,
             title=self._("选择音频/视频文件"),
-            last_directory=last_directory,
-            extensions=get_supported_media_extensions()
+            last_directory=last_directory
         )
         
         # 如果有选择文件
@@ -330,6 +386,10 @@ class TaskView(QWidget):
     
     def _on_clear_log_clicked(self):
         """清空转录内容按钮点击事件"""
+        # 丢弃尚未刷新的内容，避免已清空的文本在下一次刷新时重新出现
+        self._coalesce_timer.stop()
+        self._pending_text.clear()
+        self._pending_progress.clear()
         self.transcript_viewer.clear_display()
     
     def _on_table_cell_clicked(self, row, column):
@@ -370,8 +430,8 @@ class TaskView(QWidget):
         if not FileSystemUtils.open_directory(file_dir):
             # 使用ErrorHandlingService处理错误
             error_info = ErrorInfo(
-                message=self._(NotificationContent.DIRECTORY_OPEN_FAILED.value).format(directory_path=file_dir), # 翻译
-                category=ErrorCategory.FILE_OPERATION,
+                message=self._(_DIRECTORY_OPEN_FAILED_FMT).format(directory_path=file_dir), # 翻译
+                category=ErrorCategory.FILE_IO,
                 priority=ErrorPriority.MEDIUM,
                 source="TaskView._on_table_cell_clicked",
                 user_visible=True
@@ -382,11 +442,10 @@ class TaskView(QWidget):
     def _update_button_states(self):
         """更新按钮状态"""
         # 检查是否有任务正在处理
-        is_processing = len(self.task_service.get_active_tasks()) > 0
+        is_processing = self.task_service.get_active_count() > 0
         
-        # 获取待处理任务列表
-        pending_tasks = self.task_service.get_pending_tasks()
-        has_pending_tasks = len(pending_tasks) > 0
+        # 检查是否有待处理任务
+        has_pending_tasks = self.task_service.get_pending_count() > 0
         
         # 更新文件操作按钮状态
         self.add_button.setEnabled(not is_processing)
@@ -426,8 +485,7 @@ class TaskView(QWidget):
                 # 检查是否是文件或目录
                 if os.path.isfile(file_path):
                     # 如果是文件，检查是否有效
-                    ext = get_file_extension(file_path)
-                    if ext in get_supported_media_extensions():
+                    if is_supported_media_file(file_path):
                         has_valid_item = True
                         break
                 elif os.path.isdir(file_path):
@@ -451,7 +509,7 @@ class TaskView(QWidget):
     def dropEvent(self, event):
         """拖拽放下事件"""
         # 检查是否有任务正在处理
-        if len(self.task_service.get_active_tasks()) > 0:
+        if self.task_service.get_active_count() > 0:
             return
             
         # 获取拖拽的文件URL列表
@@ -459,38 +517,14 @@ class TaskView(QWidget):
         if not urls:
             return
             
-        # 转换为本地文件路径
-        files = []
-        for url in urls:
-            file_path = url.toLocalFile()
-            # 接受文件和文件夹
-            if os.path.exists(file_path):
-                files.append(file_path)
+        # 转换为本地文件路径（接受文件和文件夹，存在性和类型由任务服务统一校验）
+        files = [file_path for file_path in (url.toLocalFile() for url in urls) if file_path]
         
         # 添加文件
         if files:
             self.add_tasks(files)
             event.acceptProposedAction()
     
-    def event(self, event):
-        """重写事件处理函数，用于处理鼠标悬停事件"""
-        if event.type() == QEvent.HoverEnter or event.type() == QEvent.HoverMove:
-            # 获取鼠标位置下的表格项
-            pos = self.table.mapFromGlobal(self.cursor().pos())
-            item = self.table.itemAt(pos)
-            
-            # 如果鼠标在文件名列上，设置为手型光标
-            if item and self.table.column(item) == 0:
-                self.setCursor(Qt.PointingHandCursor)
-            else:
-                self.setCursor(Qt.ArrowCursor)
-                
-        elif event.type() == QEvent.HoverLeave:
-            # 鼠标离开时恢复默认光标
-            self.setCursor(Qt.ArrowCursor)
-            
-        return super().event(event)
-    
     def _on_task_completed(self, task_id: str, output_path: str):
         """任务完成处理
         
@@ -498,6 +532,8 @@ class TaskView(QWidget):
             task_id: 任务ID
             output_path: 输出文件路径
         """
+        # 先写入暂存的转录文本，保证完成消息位于该任务最后的片段之后
+        self._flush_pending()
         # 获取任务文件名
         file_name = self.task_service.get_task_file_name(task_id)
         if file_name:
@@ -510,11 +546,8 @@ class TaskView(QWidget):
     
     def _process_next_task(self):
         """处理下一个任务"""
-        # 获取所有待处理的任务
-        pending_tasks = self.task_service.get_pending_tasks()
-        
         # 如果还有待处理的任务，处理下一个
-        if pending_tasks:
+        if self.task_service.get_pending_count() > 0:
             # 发布请求开始处理事件
             event_data = RequestStartProcessingEvent()
             event_bus.publish(EventTypes.REQUEST_START_PROCESSING, event_data)
@@ -522,7 +555,7 @@ class TaskView(QWidget):
     def _on_start_clicked(self):
         """开始处理按钮点击事件"""
         # 检查是否有任务正在处理
-        if len(self.task_service.get_active_tasks()) > 0:
+        if self.task_service.get_active_count() > 0:
             # 发布请求取消处理事件
             event_data = RequestCancelProcessingEvent()
             event_bus.publish(EventTypes.REQUEST_CANCEL_PROCESSING, event_data)
@@ -535,11 +568,8 @@ class TaskView(QWidget):
             self.transcript_viewer.add_transcript_text(self._("正在取消任务，请稍候..."))
             return
         
-        # 获取所有待处理的任务
-        pending_tasks = self.task_service.get_pending_tasks()
-        
         # 如果没有待处理的任务，记录日志并返回
-        if not pending_tasks:
+        if self.task_service.get_pending_count() == 0:
             logger.debug(self._("没有待处理的任务"))
             return
             
@@ -606,23 +636,31 @@ class TaskView(QWidget):
 
     def _handle_task_added_event(self, event: TaskAddedEvent):
         """处理任务添加事件 (事件总线回调)"""
-        if hasattr(event, 'task_id') and hasattr(event, 'file_path'):
-             # 获取初始状态键
-             initial_status_key = ProcessStatus.get_display_text(ProcessStatus.WAITING)
-             # 翻译初始状态键
-             translated_initial_status = self._(f"status_{initial_status_key}")
-             # 发射信号，让槽函数在主线程更新UI
-             self.requestAddTask.emit(
-                 event.task_id,
-                 event.file_path,
-                 translated_initial_status, # 使用翻译后的状态
-                 "--:--" # 初始时长
-             )
-             # 更新按钮状态 (可以保留，因为列表内容变化可能影响按钮)
-             self._update_button_states()
-             logger.debug(f"任务添加事件处理: {event.task_id}, 发射信号更新UI")
-        else:
-            logger.warning(f"接收到无效的TASK_ADDED事件: {event}")
+        # 查表获取翻译后的初始状态文本
+        translated_initial_status = self._status_text[ProcessStatus.WAITING]
+        # 在主线程更新UI
+        self._update_table(
+            self.requestAddTask, self.table_manager.add_task_to_table,
+            event.task_id,
+            event.file_path,
+            translated_initial_status, # 使用翻译后的状态
+            "--:--" # 初始时长
+        )
+        # 更新按钮状态 (可以保留，因为列表内容变化可能影响按钮)
+        self._update_button_states()
+        logger.debug("任务添加事件处理: {}, 已更新UI", event.task_id)
+
+    def _handle_tasks_added_event(self, event: TasksAddedEvent):
+        """处理批量任务添加事件 (事件总线回调)，整批只更新一次表格和按钮状态"""
+        # 初始状态文本整批相同，查表一次
+        translated_initial_status = self._status_text[ProcessStatus.WAITING]
+        # 在主线程更新UI
+        self._update_table(self.requestAddTasks, self.table_manager.add_tasks_to_table, [
+            (task.task_id, task.file_path, translated_initial_status, "--:--")
+            for task in event.tasks
+        ])
+        self._update_button_states()
+        logger.debug("批量任务添加事件处理: {} 个任务", len(event.tasks))
 
     def _handle_model_loaded(self, event):
        """处理模型加载完成事件"""
@@ -632,9 +670,26 @@ class TaskView(QWidget):
            self.transcript_viewer.add_system_message(self._("模型 {model_name} 加载完成，开始处理任务...").format(model_name=event.model_name))
            self._start_processing_tasks() # 重新尝试开始处理
 
+    def _update_table(self, signal, slot, *args):
+        """更新任务表格
+        
+        事件总线通常已在主线程分发事件，此时直接调用表格管理器的槽函数，
+        省去信号发射；在其他线程调用时仍通过信号转交主线程
+        
+        Args:
+            signal: 连接到该槽函数的信号
+            slot: 表格管理器的槽函数
+            *args: 参数
+        """
+        if QThread.currentThread() == self.thread():
+            slot(*args)
+        else:
+            signal.emit(*args)
+
     def _connect_table_manager_signals(self):
         """连接内部信号到TaskTableManager的槽函数"""
         self.requestAddTask.connect(self.table_manager.add_task_to_table)
+        self.requestAddTasks.connect(self.table_manager.add_tasks_to_table)
         self.requestRemoveTask.connect(self.table_manager.remove_task)
         self.requestUpdateStatus.connect(self.table_manager.update_task_status)
         self.requestUpdateProgress.connect(self.table_manager.update_task_progress)
@@ -643,13 +698,10 @@ class TaskView(QWidget):
 
     def _handle_task_removed_event(self, event: TaskRemovedEvent):
         """处理任务移除事件 (事件总线回调)"""
-        if hasattr(event, 'task_id'):
-            # 发射信号，让槽函数在主线程更新UI
-            self.requestRemoveTask.emit(event.task_id)
-            # 更新全局按钮状态
-            self._update_button_states()
-        else:
-            logger.warning(f"接收到无效的TASK_REMOVED事件: {event}")
+        # 在主线程更新UI
+        self._update_table(self.requestRemoveTask, self.table_manager.remove_task, event.task_id)
+        # 更新全局按钮状态
+        self._update_button_states()
 
     def _update_duration_display(self):
         """由ui_timer触发，主动更新活跃任务的时长显示"""
@@ -658,8 +710,11 @@ class TaskView(QWidget):
             try:
                 # 主动获取最新时长
                 duration = self.task_service.get_task_duration(active_id)
-                # 发射信号更新UI (通过信号槽保证线程安全)
-                self.requestUpdateDuration.emit(active_id, duration)
+                # 时长文本未变化（或活跃任务未切换）时无需重绘单元格
+                if (active_id, duration) != self._last_duration:
+                    self._last_duration = (active_id, duration)
+                    # 发射信号更新UI (通过信号槽保证线程安全)
+                    self.requestUpdateDuration.emit(active_id, duration)
             except Exception as e:
                 # 添加错误处理，防止计时器因异常停止
                 logger.error(f"更新任务 {active_id} 时长显示时出错: {e}")
@@ -673,6 +728,8 @@ class TaskView(QWidget):
     def _handle_global_transcription_completed(self, event):
         """处理全局转录完成事件"""
         logger.info("收到全局转录完成事件")
+        # 先写入暂存的转录文本和进度
+        self._flush_pending()
         # 更新按钮状态
         self._update_button_states()
         # 记录日志
@@ -685,33 +742,25 @@ class TaskTableWidget(TableWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 未按下鼠标键时也需要接收移动事件，用于悬停时切换光标
         self.setMouseTracking(True)
         self.viewport().setMouseTracking(True)
-        self.current_column = -1
+        # 当前是否为手型光标，只在状态切换时设置光标
+        self._cursor_is_hand = False
     
     def mouseMoveEvent(self, event):
         """鼠标移动事件，实现指针变化"""
-        # 获取鼠标位置下的单元格
-        item = self.itemAt(event.pos())
-        if item:
-            column = self.column(item)
-            
-            # 如果鼠标在文件名列上，设置为手型光标
-            if column == 0:
-                self.setCursor(Qt.PointingHandCursor)
-                self.current_column = 0
-            elif self.current_column == 0:
-                self.setCursor(Qt.ArrowCursor)
-                self.current_column = column
-        else:
-            if self.current_column == 0:
-                self.setCursor(Qt.ArrowCursor)
-                self.current_column = -1
+        # 鼠标在文件名列上时使用手型光标（不在单元格上时列号为 -1）
+        is_hand = self.indexAt(event.pos()).column() == 0
+        if is_hand != self._cursor_is_hand:
+            self._cursor_is_hand = is_hand
+            self.setCursor(Qt.PointingHandCursor if is_hand else Qt.ArrowCursor)
         
         super().mouseMoveEvent(event)
     
     def leaveEvent(self, event):
         """鼠标离开事件"""
-        self.setCursor(Qt.ArrowCursor)
-        self.current_column = -1
+        if self._cursor_is_hand:
+            self._cursor_is_hand = False
+            self.setCursor(Qt.ArrowCursor)
         super().leaveEvent(event)
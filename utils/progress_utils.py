@@ -7,6 +7,10 @@ import re
 import sys
 from typing import Optional, Tuple, Callable, Any
 
+# tqdm 进度行的匹配模式："[文件名]: 37%|████ ..."，文件名部分可选
+# 一次匹配同时取出文件名和进度条标记前的百分比
+_PROGRESS_RE = re.compile(r'(?:\[(.*?)\]:.*?)?(\d+)%\|')
+
 
 def parse_progress(text: str) -> Tuple[Optional[int], Optional[str]]:
     """
@@ -21,21 +25,11 @@ def parse_progress(text: str) -> Tuple[Optional[int], Optional[str]]:
     if '%|' not in text:
         return None, None
     
-    try:
-        # 提取百分比
-        match = re.search(r'(\d+)%', text)
-        if not match:
-            return None, None
-        
-        percentage = int(match.group(1))
-        
-        # 提取文件名
-        file_match = re.search(r'\[(.*?)\]:', text)
-        filename = file_match.group(1) if file_match else None
-        
-        return percentage, filename
-    except Exception:
+    match = _PROGRESS_RE.search(text)
+    if not match:
         return None, None
+    
+    return int(match.group(2)), match.group(1)
 
 
 # Function calculate_transcription_progress removed as it's no longer used.
@@ -69,6 +63,8 @@ class ProgressWriter:
         """
         self._original_stdout = original_stdout
         self._progress_callback = progress_callback
+        # 上次回调的 (percentage, filename)，相同进度不重复回调
+        self._last_progress: Tuple[Optional[int], Optional[str]] = (None, None)
     
     def write(self, text: str) -> None:
         """
@@ -77,14 +73,18 @@ class ProgressWriter:
         Args:
             text: 要写入的文本
         """
-        percentage, filename = parse_progress(text)
-        if percentage is not None:
-            self._progress_callback(percentage, filename)
+        # 只有包含进度条标记的文本才需要解析，其余输出直接转写
+        if '%|' in text:
+            progress = parse_progress(text)
+            if progress[0] is not None and progress != self._last_progress:
+                self._last_progress = progress
+                self._progress_callback(*progress)
         
-        # 写入原始stdout
+        # 写入原始stdout，只在一行结束（换行或回车）时刷新
         if self._original_stdout:
             self._original_stdout.write(text)
-            self._original_stdout.flush()
+            if '\n' in text or '\r' in text:
+                self._original_stdout.flush()
     
     def flush(self) -> None:
         """刷新输出流"""